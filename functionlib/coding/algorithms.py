@@ -478,26 +478,27 @@ def levenshtein_distance(str1: str, str2: str) -> int:
         >>> levenshtein_distance("kitten", "sitting")
         3
     """
-    m, n = len(str1), len(str2)
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
-    
-    for i in range(m + 1):
-        dp[i][0] = i
-    for j in range(n + 1):
-        dp[0][j] = j
-    
-    for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            if str1[i - 1] == str2[j - 1]:
-                dp[i][j] = dp[i - 1][j - 1]
-            else:
-                dp[i][j] = 1 + min(
-                    dp[i - 1][j],      # deletion
-                    dp[i][j - 1],      # insertion
-                    dp[i - 1][j - 1]   # substitution
-                )
-    
-    return dp[m][n]
+    # Two-row DP with preallocated lists swapped by reference: O(n)
+    # memory instead of the full O(m*n) matrix, no per-row allocation
+    if len(str1) < len(str2):
+        str1, str2 = str2, str1
+
+    n = len(str2)
+    if n == 0:
+        return len(str1)
+
+    prev = list(range(n + 1))
+    curr = [0] * (n + 1)
+
+    for i, c1 in enumerate(str1):
+        curr[0] = i + 1
+        for j, c2 in enumerate(str2):
+            curr[j + 1] = min(prev[j + 1] + 1,      # deletion
+                              curr[j] + 1,          # insertion
+                              prev[j] + (c1 != c2)) # substitution
+        prev, curr = curr, prev
+
+    return prev[n]
 
 
 # Export all functions
@@ -8,11 +8,20 @@ All functions use pure Python stdlib (json, re) with optional yaml support.
 """
 
 import json
+import os
 import re
-from typing import Any, Dict, List, Optional, Union, Callable
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union, Callable
 from pathlib import Path
 
 
+# Parsed-JSON cache for json_get, keyed by (filepath, mtime_ns, size) so a
+# modified file is re-parsed automatically. Double-checked locking ensures
+# concurrent readers trigger at most one parse per file version.
+_json_cache_lock = threading.Lock()
+_json_cache: Dict[Tuple[str, int, int], Any] = {}
+
+
 # ============================================================================
 # Path Parsing and Navigation
 # ============================================================================
@@ -256,8 +265,21 @@ def json_get(filepath: str, path: str = '', default: Any = None) -> Any:
         'localhost'
     """
     try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        st = os.stat(filepath)
+        key = (filepath, st.st_mtime_ns, st.st_size)
+        data = _json_cache.get(key)
+        if data is None:
+            with _json_cache_lock:
+                # Re-check under the lock: another thread may have parsed
+                # the file while we were waiting.
+                data = _json_cache.get(key)
+                if data is None:
+                    with open(filepath, 'r') as f:
+                        data = json.load(f)
+                    # Drop stale entries for this file before caching
+                    for stale in [k for k in _json_cache if k[0] == filepath]:
+                        del _json_cache[stale]
+                    _json_cache[key] = data
         return get_value_by_path(data, path, default) if path else data
     except (FileNotFoundError, json.JSONDecodeError):
         return default
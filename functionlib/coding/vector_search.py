@@ -1,8 +1,20 @@
 """Vector operations and similarity search (pure Python implementation)."""
 
+import heapq
+import json
 import math
+import random
+import struct
+from functools import lru_cache
 from typing import List, Tuple, Dict, Callable, Optional, Any
 
+# Optional NumPy backend: the distance kernels drop into C SIMD loops
+# when it is installed and keep the pure-Python paths otherwise.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 __all__ = [
     'cosine_similarity',
     'euclidean_distance',
@@ -15,22 +27,74 @@ __all__ = [
     'vector_multiply',
     'vector_mean',
     'jaccard_similarity',
+    'minhash',
+    'jaccard_estimate',
     'hamming_distance',
+    'hamming_distance_packed',
     'minkowski_distance',
     'pearson_correlation',
     'spearman_correlation',
     'knn_search',
+    'knn_search_batch',
     'nearest_neighbors',
     'vector_database',
     'semantic_search',
+    'semantic_search_batch',
     'cluster_vectors',
     'dimension_reduce_pca',
     'vector_to_text_hash',
     'text_to_vector',
     'tfidf_vector',
     'create_embedding_index',
+    'lsh_search',
+    'quantized_search',
+    'save_index',
+    'load_index',
 ]
 
+# Optional Numba-compiled cosine kernel. The two-wide accumulators
+# break the serial reduction dependency chain so LLVM can keep FMA
+# units busy; cache=True persists the compiled code across processes.
+if np is not None:
+    try:
+        from numba import njit as _njit
+    except ImportError:
+        _njit = None
+else:
+    _njit = None
+
+if _njit is not None:
+    @_njit(fastmath=True, cache=True)
+    def _cos_kernel(a, b):  # pragma: no cover - needs numba
+        s0 = s1 = n0 = n1 = m0 = m1 = 0.0
+        n = a.shape[0]
+        i = 0
+        while i + 2 <= n:
+            s0 += a[i] * b[i]
+            s1 += a[i + 1] * b[i + 1]
+            n0 += a[i] * a[i]
+            n1 += a[i + 1] * a[i + 1]
+            m0 += b[i] * b[i]
+            m1 += b[i + 1] * b[i + 1]
+            i += 2
+        if i < n:
+            s0 += a[i] * b[i]
+            n0 += a[i] * a[i]
+            m0 += b[i] * b[i]
+        norm = math.sqrt(n0 + n1) * math.sqrt(m0 + m1)
+        if norm == 0.0:
+            return 0.0
+        return (s0 + s1) / norm
+else:
+    _cos_kernel = None
+
+# FNV-1a 64-bit prime, used for the deterministic text hashing below
+_HASH_PRIME = 1099511628211
+
+def _asarray(v):
+    """Convert a vector to a float64 ndarray once (NumPy installs only)."""
+    return np.asarray(v, dtype=np.float64)
+
 def cosine_similarity(v1: List[float], v2: List[float]) -> float:
     """Calculate cosine similarity between two vectors.
     
@@ -47,13 +111,23 @@ def cosine_similarity(v1: List[float], v2: List[float]) -> float:
         >>> cosine_similarity(v1, v2)
         0.974...
     """
-    dot = sum(a * b for a, b in zip(v1, v2))
-    norm1 = math.sqrt(sum(a * a for a in v1))
-    norm2 = math.sqrt(sum(b * b for b in v2))
-    
+    if _cos_kernel is not None:
+        return float(_cos_kernel(_asarray(v1), _asarray(v2)))
+
+    if np is not None:
+        a = _asarray(v1)
+        b = _asarray(v2)
+        dot = float(a @ b)
+        norm1 = float(np.linalg.norm(a))
+        norm2 = float(np.linalg.norm(b))
+    else:
+        dot = sum(a * b for a, b in zip(v1, v2))
+        norm1 = math.sqrt(sum(a * a for a in v1))
+        norm2 = math.sqrt(sum(b * b for b in v2))
+
     if norm1 == 0 or norm2 == 0:
         return 0.0
-    
+
     return dot / (norm1 * norm2)
 
 def euclidean_distance(v1: List[float], v2: List[float]) -> float:
@@ -70,6 +144,8 @@ def euclidean_distance(v1: List[float], v2: List[float]) -> float:
         >>> euclidean_distance([0, 0], [3, 4])
         5.0
     """
+    if np is not None:
+        return float(np.linalg.norm(_asarray(v1) - _asarray(v2)))
     return math.sqrt(sum((a - b) ** 2 for a, b in zip(v1, v2)))
 
 def manhattan_distance(v1: List[float], v2: List[float]) -> float:
@@ -86,6 +162,8 @@ def manhattan_distance(v1: List[float], v2: List[float]) -> float:
         >>> manhattan_distance([0, 0], [3, 4])
         7.0
     """
+    if np is not None:
+        return float(np.abs(_asarray(v1) - _asarray(v2)).sum())
     return sum(abs(a - b) for a, b in zip(v1, v2))
 
 def dot_product(v1: List[float], v2: List[float]) -> float:
@@ -102,6 +180,8 @@ def dot_product(v1: List[float], v2: List[float]) -> float:
         >>> dot_product([1, 2, 3], [4, 5, 6])
         32
     """
+    if np is not None:
+        return float(_asarray(v1) @ _asarray(v2))
     return sum(a * b for a, b in zip(v1, v2))
 
 def vector_norm(v: List[float], p: int = 2) -> float:
@@ -138,6 +218,10 @@ def normalize_vector(v: List[float]) -> List[float]:
         >>> normalize_vector([3, 4])
         [0.6, 0.8]
     """
+    # ndarray in, ndarray out: no per-element boxing for array callers
+    if np is not None and isinstance(v, np.ndarray):
+        n = float(np.linalg.norm(v))
+        return v if n == 0 else v / n
     norm = vector_norm(v)
     if norm == 0:
         return v
@@ -157,6 +241,8 @@ def vector_add(v1: List[float], v2: List[float]) -> List[float]:
         >>> vector_add([1, 2], [3, 4])
         [4, 6]
     """
+    if np is not None and (isinstance(v1, np.ndarray) or isinstance(v2, np.ndarray)):
+        return np.asarray(v1) + np.asarray(v2)
     return [a + b for a, b in zip(v1, v2)]
 
 def vector_subtract(v1: List[float], v2: List[float]) -> List[float]:
@@ -173,6 +259,8 @@ def vector_subtract(v1: List[float], v2: List[float]) -> List[float]:
         >>> vector_subtract([5, 7], [2, 3])
         [3, 4]
     """
+    if np is not None and (isinstance(v1, np.ndarray) or isinstance(v2, np.ndarray)):
+        return np.asarray(v1) - np.asarray(v2)
     return [a - b for a, b in zip(v1, v2)]
 
 def vector_multiply(v: List[float], scalar: float) -> List[float]:
@@ -189,6 +277,8 @@ def vector_multiply(v: List[float], scalar: float) -> List[float]:
         >>> vector_multiply([1, 2, 3], 2)
         [2, 4, 6]
     """
+    if np is not None and isinstance(v, np.ndarray):
+        return v * scalar
     return [x * scalar for x in v]
 
 def vector_mean(vectors: List[List[float]]) -> List[float]:
@@ -206,11 +296,18 @@ def vector_mean(vectors: List[List[float]]) -> List[float]:
     """
     if not vectors:
         return []
-    
+
+    if np is not None:
+        return np.asarray(vectors, dtype=np.float64).mean(axis=0).tolist()
+
+    # Accumulate row-major: one pass in storage order instead of dim
+    # strided column walks over the list of lists
     n = len(vectors)
-    dim = len(vectors[0])
-    
-    return [sum(v[i] for v in vectors) / n for i in range(dim)]
+    acc = [0.0] * len(vectors[0])
+    for v in vectors:
+        for i, x in enumerate(v):
+            acc[i] += x
+    return [s / n for s in acc]
 
 def jaccard_similarity(s1: set, s2: set) -> float:
     """Calculate Jaccard similarity between sets.
@@ -231,6 +328,58 @@ def jaccard_similarity(s1: set, s2: set) -> float:
     
     return intersection / union if union > 0 else 0.0
 
+# Mersenne prime for the (a*x + b) mod p universal hash family
+_MINHASH_PRIME = (1 << 61) - 1
+
+@lru_cache(maxsize=8)
+def _minhash_params(k: int, seed: int) -> Tuple[Tuple[int, int], ...]:
+    """k (a, b) coefficient pairs, fixed per (k, seed)."""
+    rng = random.Random(seed)
+    return tuple((rng.randrange(1, _MINHASH_PRIME),
+                  rng.randrange(_MINHASH_PRIME)) for _ in range(k))
+
+def minhash(s: set, k: int = 128, seed: int = 0) -> List[int]:
+    """Compute a MinHash signature for a set.
+
+    Two signatures built with the same k and seed estimate the Jaccard
+    similarity of their sets in O(k) via jaccard_estimate, instead of
+    O(|s1| + |s2|) per comparison — the classic trick for repeated
+    all-pairs set similarity.
+
+    Args:
+        s: Input set
+        k: Signature length (error ~ 1/sqrt(k))
+        seed: Hash-family seed; signatures are only comparable when
+            built with the same seed
+
+    Returns:
+        Signature of k per-hash minima
+    """
+    params = _minhash_params(k, seed)
+    if not s:
+        return [_MINHASH_PRIME] * k
+
+    # Hash every element once up front; each of the k rows then only
+    # pays the affine transform and min
+    hashes = [hash(x) % _MINHASH_PRIME for x in s]
+    return [min((a * h + b) % _MINHASH_PRIME for h in hashes)
+            for a, b in params]
+
+def jaccard_estimate(sig1: List[int], sig2: List[int]) -> float:
+    """Estimate Jaccard similarity from two MinHash signatures.
+
+    Args:
+        sig1: First signature (from minhash)
+        sig2: Second signature, same k and seed
+
+    Returns:
+        Estimated Jaccard similarity (0 to 1)
+    """
+    if not sig1:
+        return 0.0
+    matches = sum(a == b for a, b in zip(sig1, sig2))
+    return matches / len(sig1)
+
 def hamming_distance(v1: List[int], v2: List[int]) -> int:
     """Calculate Hamming distance between binary vectors.
     
@@ -245,7 +394,33 @@ def hamming_distance(v1: List[int], v2: List[int]) -> int:
         >>> hamming_distance([1, 0, 1, 1], [1, 1, 1, 0])
         2
     """
-    return sum(a != b for a, b in zip(v1, v2))
+    if np is not None:
+        return int(np.count_nonzero(np.asarray(v1) != np.asarray(v2)))
+
+    # Pack each vector into one big int and popcount the XOR: 64+ bits
+    # per machine instruction instead of one comparison per element
+    a = 0
+    b = 0
+    for x, y in zip(v1, v2):
+        a = (a << 1) | (x != 0)
+        b = (b << 1) | (y != 0)
+    return (a ^ b).bit_count()
+
+def hamming_distance_packed(a: int, b: int) -> int:
+    """Hamming distance between two already bit-packed vectors.
+
+    Args:
+        a: First vector, packed as an int (one bit per component)
+        b: Second vector, packed the same way
+
+    Returns:
+        Hamming distance
+
+    Example:
+        >>> hamming_distance_packed(0b1011, 0b1110)
+        2
+    """
+    return (a ^ b).bit_count()
 
 def minkowski_distance(v1: List[float], v2: List[float], p: int = 2) -> float:
     """Calculate Minkowski distance.
@@ -262,6 +437,8 @@ def minkowski_distance(v1: List[float], v2: List[float], p: int = 2) -> float:
         >>> minkowski_distance([0, 0], [3, 4], 2)
         5.0
     """
+    if np is not None:
+        return float((np.abs(_asarray(v1) - _asarray(v2)) ** p).sum() ** (1/p))
     return sum(abs(a - b) ** p for a, b in zip(v1, v2)) ** (1/p)
 
 def pearson_correlation(v1: List[float], v2: List[float]) -> float:
@@ -279,17 +456,32 @@ def pearson_correlation(v1: List[float], v2: List[float]) -> float:
         1.0
     """
     n = len(v1)
-    mean1 = sum(v1) / n
-    mean2 = sum(v2) / n
-    
-    numerator = sum((v1[i] - mean1) * (v2[i] - mean2) for i in range(n))
-    denom1 = math.sqrt(sum((v1[i] - mean1) ** 2 for i in range(n)))
-    denom2 = math.sqrt(sum((v2[i] - mean2) ** 2 for i in range(n)))
-    
-    if denom1 == 0 or denom2 == 0:
+
+    if np is not None:
+        a = np.asarray(v1, dtype=np.float64)
+        b = np.asarray(v2, dtype=np.float64)
+        if a.std() == 0 or b.std() == 0:
+            return 0.0
+        return float(np.corrcoef(a, b)[0, 1])
+
+    # One fused pass accumulating the five sufficient statistics,
+    # instead of two mean passes plus three centered-product passes
+    sx = sy = sxy = sxx = syy = 0.0
+    for x, y in zip(v1, v2):
+        sx += x
+        sy += y
+        sxy += x * y
+        sxx += x * x
+        syy += y * y
+
+    numerator = sxy - sx * sy / n
+    var1 = max(sxx - sx * sx / n, 0.0)
+    var2 = max(syy - sy * sy / n, 0.0)
+
+    if var1 == 0 or var2 == 0:
         return 0.0
-    
-    return numerator / (denom1 * denom2)
+
+    return numerator / math.sqrt(var1 * var2)
 
 def spearman_correlation(v1: List[float], v2: List[float]) -> float:
     """Calculate Spearman rank correlation.
@@ -305,20 +497,28 @@ def spearman_correlation(v1: List[float], v2: List[float]) -> float:
         >>> spearman_correlation([1, 2, 3, 4], [1, 3, 2, 4])
         0.8
     """
-    def rank(v):
-        sorted_v = sorted(enumerate(v), key=lambda x: x[1])
-        ranks = [0] * len(v)
-        for rank_val, (idx, _) in enumerate(sorted_v, 1):
-            ranks[idx] = rank_val
-        return ranks
-    
+    if np is not None:
+        def rank(v):
+            # argsort + scatter assigns all ranks in two C passes
+            order = np.argsort(np.asarray(v), kind='stable')
+            ranks = np.empty(len(v), dtype=np.int64)
+            ranks[order] = np.arange(1, len(v) + 1)
+            return ranks.tolist()
+    else:
+        def rank(v):
+            sorted_v = sorted(enumerate(v), key=lambda x: x[1])
+            ranks = [0] * len(v)
+            for rank_val, (idx, _) in enumerate(sorted_v, 1):
+                ranks[idx] = rank_val
+            return ranks
+
     ranks1 = rank(v1)
     ranks2 = rank(v2)
-    
+
     return pearson_correlation(ranks1, ranks2)
 
 def knn_search(query: List[float], vectors: List[List[float]], k: int = 5,
-               metric: str = 'cosine') -> List[Tuple[int, float]]:
+               metric: str = 'cosine', norms_sq=None) -> List[Tuple[int, float]]:
     """Find k nearest neighbors.
     
     Args:
@@ -326,7 +526,9 @@ def knn_search(query: List[float], vectors: List[List[float]], k: int = 5,
         vectors: Database vectors
         k: Number of neighbors
         metric: Distance metric ('cosine', 'euclidean', 'manhattan')
-        
+        norms_sq: Optional precomputed squared norms of the database
+            vectors (e.g. vector_database()['norms_sq'])
+
     Returns:
         List of (index, distance) tuples
         
@@ -335,17 +537,111 @@ def knn_search(query: List[float], vectors: List[List[float]], k: int = 5,
         >>> knn_search([0.9, 0.1], vectors, k=2)
         [(0, ...), (2, ...)]
     """
+    if metric not in ('cosine', 'euclidean', 'manhattan'):
+        raise ValueError(f"Unknown metric: {metric}")
+
+    if np is not None and len(vectors):
+        # One BLAS matvec / broadcast over the stacked (N, d) matrix
+        # instead of N per-vector Python calls
+        M = np.asarray(vectors, dtype=np.float64)
+        q = _asarray(query)
+        if metric == 'cosine':
+            norms = np.linalg.norm(M, axis=1) * float(np.linalg.norm(q))
+            dists = 1.0 - np.divide(M @ q, norms, out=np.zeros(len(M)),
+                                    where=norms != 0)
+        elif metric == 'euclidean':
+            # ||x-y||^2 = ||y||^2 + ||x||^2 - 2 x.y: one matvec plus
+            # amortizable per-row norms instead of an (N, d) difference
+            # temporary; ranks identically to the true distance, so the
+            # sqrt is deferred to the k winners
+            ns = norms_sq if norms_sq is not None \
+                else np.einsum('ij,ij->i', M, M)
+            dists = np.maximum(ns + float(q @ q) - 2.0 * (M @ q), 0.0)
+        else:
+            dists = np.abs(M - q).sum(axis=1)
+        if k < dists.shape[0]:
+            # argpartition selects the k smallest in O(N); only those
+            # k are fully sorted
+            idx = np.argpartition(dists, k)[:k]
+            idx = idx[np.argsort(dists[idx])]
+        else:
+            idx = np.argsort(dists)
+        top = dists[idx]
+        if metric == 'euclidean':
+            top = np.sqrt(top)
+        return list(zip(idx.tolist(), top.tolist()))
+
     if metric == 'cosine':
-        distances = [(i, 1 - cosine_similarity(query, v)) for i, v in enumerate(vectors)]
+        # Hoist the query norm out of the loop; cosine_similarity would
+        # recompute it for every database vector
+        qnorm = math.sqrt(sum(a * a for a in query))
+        distances = []
+        for i, v in enumerate(vectors):
+            dot = sum(a * b for a, b in zip(query, v))
+            vnorm = math.sqrt(sum(b * b for b in v))
+            sim = dot / (qnorm * vnorm) if qnorm and vnorm else 0.0
+            distances.append((i, 1 - sim))
     elif metric == 'euclidean':
         distances = [(i, euclidean_distance(query, v)) for i, v in enumerate(vectors)]
-    elif metric == 'manhattan':
-        distances = [(i, manhattan_distance(query, v)) for i, v in enumerate(vectors)]
     else:
+        distances = [(i, manhattan_distance(query, v)) for i, v in enumerate(vectors)]
+
+    # O(N log k) heap selection rather than sorting all N distances
+    return heapq.nsmallest(k, distances, key=lambda x: x[1])
+
+def knn_search_batch(queries: List[List[float]], vectors: List[List[float]],
+                     k: int = 5, metric: str = 'cosine') -> List[List[Tuple[int, float]]]:
+    """Find k nearest neighbors for many queries at once.
+
+    One (Q, d) @ (d, N) GEMM replaces Q separate matvecs, so the BLAS
+    kernel runs at matrix-matrix arithmetic intensity instead of being
+    bandwidth-bound per query.
+
+    Args:
+        queries: Query vectors
+        vectors: Database vectors
+        k: Number of neighbors per query
+        metric: Distance metric ('cosine', 'euclidean', 'manhattan')
+
+    Returns:
+        One (index, distance) result list per query
+
+    Example:
+        >>> hits = knn_search_batch([[1, 0], [0, 1]], [[1, 0], [0, 1]], k=1)
+        >>> [h[0][0] for h in hits]
+        [0, 1]
+    """
+    if metric not in ('cosine', 'euclidean', 'manhattan'):
         raise ValueError(f"Unknown metric: {metric}")
-    
-    distances.sort(key=lambda x: x[1])
-    return distances[:k]
+
+    if np is None or not len(vectors) or not len(queries):
+        return [knn_search(q, vectors, k=k, metric=metric) for q in queries]
+
+    M = np.asarray(vectors, dtype=np.float64)
+    Q = np.asarray(queries, dtype=np.float64)
+    if metric == 'cosine':
+        norms = (np.linalg.norm(Q, axis=1)[:, None]
+                 * np.linalg.norm(M, axis=1)[None, :])
+        dists = 1.0 - np.divide(Q @ M.T, norms, out=np.zeros(norms.shape),
+                                where=norms != 0)
+    elif metric == 'euclidean':
+        # Squared-distance identity again; sqrt deferred to the winners
+        m_sq = np.einsum('ij,ij->i', M, M)
+        q_sq = np.einsum('ij,ij->i', Q, Q)
+        dists = np.maximum(q_sq[:, None] + m_sq[None, :] - 2.0 * (Q @ M.T), 0.0)
+    else:
+        dists = np.abs(Q[:, None, :] - M[None, :, :]).sum(axis=2)
+
+    if k < dists.shape[1]:
+        idx = np.argpartition(dists, k, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(dists, idx, axis=1), axis=1)
+        idx = np.take_along_axis(idx, order, axis=1)
+    else:
+        idx = np.argsort(dists, axis=1)
+    top = np.take_along_axis(dists, idx, axis=1)
+    if metric == 'euclidean':
+        top = np.sqrt(top)
+    return [list(zip(r.tolist(), d.tolist())) for r, d in zip(idx, top)]
 
 def nearest_neighbors(query: List[float], vectors: List[List[float]],
                      threshold: float = 0.8, metric: str = 'cosine') -> List[int]:
@@ -354,25 +650,55 @@ def nearest_neighbors(query: List[float], vectors: List[List[float]],
     Args:
         query: Query vector
         vectors: Database vectors
-        threshold: Similarity threshold
+        threshold: Minimum similarity ('cosine') or maximum distance
+            ('euclidean', 'manhattan')
         metric: Similarity metric
-        
+
     Returns:
         List of matching indices
-        
+
     Example:
         >>> vectors = [[1, 0], [0.9, 0.1], [0, 1]]
         >>> nearest_neighbors([1, 0], vectors, threshold=0.9)
         [0, 1]
     """
-    neighbors = []
-    
-    for i, v in enumerate(vectors):
+    if metric not in ('cosine', 'euclidean', 'manhattan'):
+        raise ValueError(f"Unknown metric: {metric}")
+
+    if np is not None and len(vectors):
+        # One matvec / broadcast over the stacked matrix, then a single
+        # vectorized threshold compare
+        M = np.asarray(vectors, dtype=np.float64)
+        q = _asarray(query)
         if metric == 'cosine':
-            similarity = cosine_similarity(query, v)
-            if similarity >= threshold:
+            norms = np.linalg.norm(M, axis=1) * float(np.linalg.norm(q))
+            sims = np.divide(M @ q, norms, out=np.zeros(len(M)),
+                             where=norms != 0)
+            return np.nonzero(sims >= threshold)[0].tolist()
+        if metric == 'euclidean':
+            dists = np.linalg.norm(M - q, axis=1)
+        else:
+            dists = np.abs(M - q).sum(axis=1)
+        return np.nonzero(dists <= threshold)[0].tolist()
+
+    neighbors = []
+
+    if metric == 'cosine':
+        # Hoist the query norm; cosine_similarity recomputes it per row
+        qnorm = math.sqrt(sum(a * a for a in query))
+        for i, v in enumerate(vectors):
+            dot = sum(a * b for a, b in zip(query, v))
+            vnorm = math.sqrt(sum(b * b for b in v))
+            sim = dot / (qnorm * vnorm) if qnorm and vnorm else 0.0
+            if sim >= threshold:
                 neighbors.append(i)
-    
+    elif metric == 'euclidean':
+        neighbors = [i for i, v in enumerate(vectors)
+                     if euclidean_distance(query, v) <= threshold]
+    else:
+        neighbors = [i for i, v in enumerate(vectors)
+                     if manhattan_distance(query, v) <= threshold]
+
     return neighbors
 
 def vector_database(vectors: List[List[float]], metadata: Optional[List[Dict]] = None) -> Dict:
@@ -390,12 +716,19 @@ def vector_database(vectors: List[List[float]], metadata: Optional[List[Dict]] =
         >>> len(db['vectors'])
         2
     """
-    return {
+    db = {
         'vectors': vectors,
         'metadata': metadata or [{} for _ in vectors],
         'size': len(vectors),
         'dimension': len(vectors[0]) if vectors else 0
     }
+    if np is not None and vectors:
+        # Contiguous float32 matrix: one machine word per component
+        # instead of a boxed PyFloat, and ready for the batched
+        # query path; squared norms are amortized across all queries
+        db['matrix'] = np.ascontiguousarray(vectors, dtype=np.float32)
+        db['norms_sq'] = np.einsum('ij,ij->i', db['matrix'], db['matrix'])
+    return db
 
 def semantic_search(query: List[float], db: Dict, k: int = 5) -> List[Dict]:
     """Semantic search in vector database.
@@ -414,7 +747,9 @@ def semantic_search(query: List[float], db: Dict, k: int = 5) -> List[Dict]:
         >>> len(results) == 1
         True
     """
-    neighbors = knn_search(query, db['vectors'], k=k, metric='cosine')
+    # Prefer the precomputed contiguous matrix over the boxed lists
+    vectors = db['matrix'] if 'matrix' in db else db['vectors']
+    neighbors = knn_search(query, vectors, k=k, metric='cosine')
     
     results = []
     for idx, distance in neighbors:
@@ -427,6 +762,25 @@ def semantic_search(query: List[float], db: Dict, k: int = 5) -> List[Dict]:
     
     return results
 
+def semantic_search_batch(queries: List[List[float]], db: Dict, k: int = 5) -> List[List[Dict]]:
+    """Semantic search for many queries against one database.
+
+    Args:
+        queries: Query vectors
+        db: Vector database
+        k: Number of results per query
+
+    Returns:
+        One result list (as from semantic_search) per query
+    """
+    vectors = db['matrix'] if 'matrix' in db else db['vectors']
+    batched = knn_search_batch(queries, vectors, k=k, metric='cosine')
+    return [
+        [{'index': idx, 'score': 1 - distance, 'metadata': db['metadata'][idx]}
+         for idx, distance in hits]
+        for hits in batched
+    ]
+
 def cluster_vectors(vectors: List[List[float]], n_clusters: int = 3) -> List[int]:
     """Simple k-means clustering of vectors.
     
@@ -443,34 +797,67 @@ def cluster_vectors(vectors: List[List[float]], n_clusters: int = 3) -> List[int
         >>> len(set(labels)) == 2
         True
     """
-    import random
-    
+    if np is not None:
+        X = np.asarray(vectors, dtype=np.float32)
+        C = X[random.sample(range(len(vectors)), n_clusters)].copy()
+        labels = np.zeros(len(vectors), dtype=np.intp)
+        x_sq = np.einsum('ij,ij->i', X, X)
+        for _ in range(100):  # Max iterations
+            # ||x-c||^2 = ||x||^2 + ||c||^2 - 2 x.c: the assignment is
+            # one cache-blocked GEMM plus per-row norms, with only the
+            # (N, K) distance matrix as a temporary - no (N, K, D)
+            # broadcast intermediate blowing out the cache. sqrt is
+            # monotonic so argmin on squares picks the same centroid.
+            c_sq = np.einsum('ij,ij->i', C, C)
+            d2 = x_sq[:, None] + c_sq[None, :] - 2.0 * (X @ C.T)
+            labels = d2.argmin(axis=1)
+            new_C = np.empty_like(C)
+            for i in range(n_clusters):
+                members = X[labels == i]
+                new_C[i] = members.mean(axis=0) if len(members) else C[i]
+            if float(np.linalg.norm(new_C - C, axis=1).max()) < 1e-6:
+                break
+            C = new_C
+        return labels.tolist()
+
     # Initialize centroids randomly
     centroids = random.sample(vectors, n_clusters)
-    
+    dim = len(vectors[0]) if vectors else 0
+
     for _ in range(100):  # Max iterations
-        # Assign to nearest centroid
+        # Assign to nearest centroid on squared distances (no sqrt)
         labels = []
         for v in vectors:
-            distances = [euclidean_distance(v, c) for c in centroids]
-            labels.append(distances.index(min(distances)))
-        
-        # Update centroids
-        new_centroids = []
-        for i in range(n_clusters):
-            cluster_vectors = [vectors[j] for j in range(len(vectors)) if labels[j] == i]
-            if cluster_vectors:
-                new_centroids.append(vector_mean(cluster_vectors))
-            else:
-                new_centroids.append(centroids[i])
-        
+            best = 0
+            best_d2 = math.inf
+            for ci, c in enumerate(centroids):
+                d2 = sum((a - b) ** 2 for a, b in zip(v, c))
+                if d2 < best_d2:
+                    best_d2 = d2
+                    best = ci
+            labels.append(best)
+
+        # Update centroids in one pass over the points instead of one
+        # filtered rebuild of the dataset per cluster
+        sums = [[0.0] * dim for _ in range(n_clusters)]
+        counts = [0] * n_clusters
+        for v, label in zip(vectors, labels):
+            counts[label] += 1
+            s = sums[label]
+            for j, x in enumerate(v):
+                s[j] += x
+        new_centroids = [
+            [x / counts[i] for x in sums[i]] if counts[i] else centroids[i]
+            for i in range(n_clusters)
+        ]
+
         # Check convergence
-        if all(euclidean_distance(new_centroids[i], centroids[i]) < 1e-6 
+        if all(euclidean_distance(new_centroids[i], centroids[i]) < 1e-6
                for i in range(n_clusters)):
             break
-        
+
         centroids = new_centroids
-    
+
     return labels
 
 def dimension_reduce_pca(vectors: List[List[float]], n_components: int = 2) -> List[List[float]]:
@@ -489,10 +876,18 @@ def dimension_reduce_pca(vectors: List[List[float]], n_components: int = 2) -> L
         >>> len(reduced[0]) == 2
         True
     """
+    if np is not None:
+        # Proper PCA: project the centered data onto the top singular
+        # vectors (BLAS SVD), not just the first raw coordinates
+        X = np.asarray(vectors, dtype=np.float64)
+        Xc = X - X.mean(axis=0)
+        _, _, Vt = np.linalg.svd(Xc, full_matrices=False)
+        return (Xc @ Vt[:n_components].T).tolist()
+
     # Center the data
     mean = vector_mean(vectors)
     centered = [vector_subtract(v, mean) for v in vectors]
-    
+
     # Simplified: just take first n_components dimensions
     # (Real PCA would compute covariance matrix and eigenvectors)
     return [[v[i] for i in range(min(n_components, len(v)))] for v in centered]
@@ -528,16 +923,34 @@ def text_to_vector(text: str, dimension: int = 100) -> List[float]:
         >>> len(v) == 10
         True
     """
+    # Deterministic prime-multiply hash over the UTF-8 bytes; the old
+    # hash(char) is salted per process, so vectors were not reproducible
+    # across runs
+    data = text.encode('utf-8')
+
+    if np is not None:
+        b = np.frombuffer(data, dtype=np.uint8).astype(np.int64)
+        idx = (b * _HASH_PRIME + np.arange(len(b))) % dimension
+        v = np.zeros(dimension, dtype=np.float64)
+        np.add.at(v, idx, 1.0)
+        n = float(np.linalg.norm(v))
+        return (v / n).tolist() if n else v.tolist()
+
     vector = [0.0] * dimension
-    
-    for i, char in enumerate(text):
-        idx = (hash(char) + i) % dimension
+
+    for i, byte in enumerate(data):
+        idx = (byte * _HASH_PRIME + i) % dimension
         vector[idx] += 1.0
-    
+
     # Normalize
     return normalize_vector(vector)
 
-def tfidf_vector(document: str, vocabulary: List[str], 
+@lru_cache(maxsize=16)
+def _vocab_index(vocabulary: Tuple[str, ...]) -> Dict[str, int]:
+    """term -> position map, memoized per vocabulary."""
+    return {term: i for i, term in enumerate(vocabulary)}
+
+def tfidf_vector(document: str, vocabulary: List[str],
                  idf_scores: Dict[str, float]) -> List[float]:
     """Create TF-IDF vector for document.
     
@@ -556,30 +969,203 @@ def tfidf_vector(document: str, vocabulary: List[str],
         >>> len(v) == 2
         True
     """
+    vector = [0.0] * len(vocabulary)
     words = document.lower().split()
+    if not words:
+        return vector
+
     word_count = {}
     for word in words:
         word_count[word] = word_count.get(word, 0) + 1
-    
-    vector = []
-    for term in vocabulary:
-        tf = word_count.get(term, 0) / len(words) if words else 0
-        idf = idf_scores.get(term, 0)
-        vector.append(tf * idf)
-    
+
+    # Scatter the document's terms into the vector instead of probing
+    # the counts once per vocabulary entry: O(|doc|) lookups, not
+    # O(|vocab|), and absent terms stay 0.0 for free
+    index = _vocab_index(tuple(vocabulary))
+    inv_n = 1.0 / len(words)
+    for word, count in word_count.items():
+        j = index.get(word)
+        if j is not None:
+            vector[j] = count * inv_n * idf_scores.get(word, 0)
+
     return vector
 
-def create_embedding_index(vectors: List[List[float]], 
-                           ids: Optional[List[str]] = None) -> Dict:
+def _lsh_code(v, planes) -> int:
+    """Hash a vector to one bit per hyperplane, packed into an int."""
+    code = 0
+    if np is not None:
+        for bit in ((planes @ _asarray(v)) > 0).tolist():
+            code = (code << 1) | bit
+        return code
+    for plane in planes:
+        code = (code << 1) | (sum(a * b for a, b in zip(plane, v)) > 0)
+    return code
+
+def _build_lsh_tables(vectors, dimension: int, n_tables: int,
+                      n_bits: int) -> Dict:
+    """Build random-hyperplane LSH tables mapping codes to row indices.
+
+    Vectors whose signs agree on all n_bits hyperplanes of a table land
+    in the same bucket, so a query only has to scan the union of its
+    own buckets instead of the full database.
+    """
+    rng = random.Random(0x5eed)  # fixed seed: index must be reproducible
+    planes = [[[rng.gauss(0.0, 1.0) for _ in range(dimension)]
+               for _ in range(n_bits)] for _ in range(n_tables)]
+    if np is not None:
+        planes = [np.asarray(p) for p in planes]
+        M = np.asarray(vectors, dtype=np.float64)
+        weights = 1 << np.arange(n_bits - 1, -1, -1)
+        tables = []
+        for P in planes:
+            codes = ((M @ P.T) > 0) @ weights
+            table = {}
+            for i, code in enumerate(codes.tolist()):
+                table.setdefault(code, []).append(i)
+            tables.append(table)
+    else:
+        tables = []
+        for p in planes:
+            table = {}
+            for i, v in enumerate(vectors):
+                table.setdefault(_lsh_code(v, p), []).append(i)
+            tables.append(table)
+    return {'planes': planes, 'tables': tables}
+
+def lsh_search(query: List[float], index: Dict, k: int = 5) -> List[Tuple[int, float]]:
+    """Approximate nearest-neighbor search using the index's LSH tables.
+
+    Args:
+        query: Query vector
+        index: Index from create_embedding_index(..., index_type='lsh')
+        k: Number of neighbors
+
+    Returns:
+        List of (index, cosine distance) tuples
+
+    Example:
+        >>> index = create_embedding_index([[1, 0], [0, 1]], index_type='lsh')
+        >>> lsh_search([0.9, 0.1], index, k=1)[0][0]
+        0
+    """
+    lsh = index.get('lsh')
+    if lsh is None:
+        return knn_search(query, index['vectors'], k=k)
+
+    candidates = set()
+    for planes, table in zip(lsh['planes'], lsh['tables']):
+        candidates.update(table.get(_lsh_code(query, planes), ()))
+    if not candidates:
+        # No bucket collision anywhere; fall back to the exact scan
+        return knn_search(query, index['vectors'], k=k)
+
+    order = sorted(candidates)
+    subset = [index['vectors'][i] for i in order]
+    return [(order[i], dist) for i, dist in knn_search(query, subset, k=k)]
+
+def save_index(db: Dict, path: str) -> None:
+    """Persist an index's vectors as raw float32 rows plus a sidecar.
+
+    The matrix goes to `path` in row-major float32; shape metadata goes
+    to `path + '.json'` so load_index can map it back without guessing.
+
+    Args:
+        db: Index from vector_database or create_embedding_index
+        path: Destination file for the raw matrix
+    """
+    if np is not None and 'matrix' in db:
+        db['matrix'].tofile(path)
+    else:
+        with open(path, 'wb') as f:
+            for v in db['vectors']:
+                f.write(struct.pack(f'{len(v)}f', *v))
+    with open(path + '.json', 'w') as f:
+        json.dump({'size': db['size'], 'dimension': db['dimension'],
+                   'dtype': 'float32'}, f)
+
+def load_index(path: str) -> Dict:
+    """Load an index saved by save_index, memory-mapping the matrix.
+
+    With NumPy the matrix comes back as an np.memmap, so the OS pages
+    rows in on demand and indexes larger than RAM stay queryable; the
+    batched matmul paths stream through it sequentially. Without NumPy
+    the rows are read eagerly into lists.
+
+    Args:
+        path: File written by save_index
+
+    Returns:
+        Database dict compatible with semantic_search / knn_search
+    """
+    with open(path + '.json') as f:
+        meta = json.load(f)
+    n, d = meta['size'], meta['dimension']
+
+    db = {'size': n, 'dimension': d, 'metadata': [{} for _ in range(n)]}
+    if np is not None:
+        mat = np.memmap(path, dtype=np.float32, mode='r', shape=(n, d))
+        db['matrix'] = mat
+        db['vectors'] = mat
+        db['norms_sq'] = np.einsum('ij,ij->i', mat, mat)
+    else:
+        with open(path, 'rb') as f:
+            data = f.read()
+        db['vectors'] = [list(row) for row in struct.iter_unpack(f'{d}f', data)] \
+            if d else [[] for _ in range(n)]
+    return db
+
+def quantized_search(query: List[float], index: Dict, k: int = 5) -> List[Tuple[int, float]]:
+    """Top-k dot-product search on an int8-quantized index.
+
+    Args:
+        query: Query vector
+        index: Index from create_embedding_index(..., dtype='int8')
+        k: Number of results
+
+    Returns:
+        List of (index, rescaled dot product) tuples, best first
+    """
+    if 'matrix_i8' not in index:
+        # No quantized matrix (built without NumPy or dtype='float32')
+        return knn_search(query, index['vectors'], k=k)
+
+    q = _asarray(query)
+    q_scale = float(np.max(np.abs(q))) / 127.0 if len(q) else 1.0
+    if q_scale == 0:
+        q_scale = 1.0
+    q_i8 = np.round(q / q_scale).astype(np.int8)
+
+    # int32 GEMV over the packed rows, then one rescale by both scales
+    dots = index['matrix_i8'].astype(np.int32) @ q_i8.astype(np.int32)
+    dots = dots.astype(np.float64) * index['scales'] * q_scale
+
+    if k < dots.shape[0]:
+        idx = np.argpartition(-dots, k)[:k]
+        idx = idx[np.argsort(-dots[idx])]
+    else:
+        idx = np.argsort(-dots)
+    return list(zip(idx.tolist(), dots[idx].tolist()))
+
+def create_embedding_index(vectors: List[List[float]],
+                           ids: Optional[List[str]] = None,
+                           index_type: str = 'flat',
+                           n_tables: int = 8, n_bits: int = 16,
+                           dtype: str = 'float32') -> Dict:
     """Create searchable embedding index.
-    
+
     Args:
         vectors: Embedding vectors
         ids: Optional IDs for each vector
-        
+        index_type: 'flat' for brute-force scans, 'lsh' to also build
+            random-projection tables for sub-linear lsh_search queries
+        n_tables: Number of LSH hash tables (index_type='lsh')
+        n_bits: Hyperplane bits per table (index_type='lsh')
+        dtype: 'float32', or 'int8' to also store a per-vector-scaled
+            int8 matrix for quantized_search (4x smaller, needs NumPy)
+
     Returns:
         Index structure
-        
+
     Example:
         >>> vectors = [[1, 0], [0, 1]]
         >>> index = create_embedding_index(vectors, ids=['a', 'b'])
@@ -589,10 +1175,25 @@ def create_embedding_index(vectors: List[List[float]],
     if ids is None:
         ids = [str(i) for i in range(len(vectors))]
     
-    return {
+    index = {
         'vectors': vectors,
         'ids': ids,
         'id_to_idx': {id_: i for i, id_ in enumerate(ids)},
         'size': len(vectors),
         'dimension': len(vectors[0]) if vectors else 0
     }
+    if np is not None and vectors:
+        index['matrix'] = np.ascontiguousarray(vectors, dtype=np.float32)
+        index['norms_sq'] = np.einsum('ij,ij->i', index['matrix'], index['matrix'])
+        if dtype == 'int8':
+            # Per-vector symmetric quantization: one float32 scale per
+            # row maps [-max, max] onto [-127, 127]
+            scales = np.max(np.abs(index['matrix']), axis=1) / 127.0
+            scales = np.where(scales == 0, 1.0, scales)
+            index['matrix_i8'] = np.round(
+                index['matrix'] / scales[:, None]).astype(np.int8)
+            index['scales'] = scales
+    if index_type == 'lsh' and vectors:
+        index['lsh'] = _build_lsh_tables(vectors, index['dimension'],
+                                         n_tables, n_bits)
+    return index
@@ -5,14 +5,32 @@ Provides workflow definition, task dependencies, execution, and monitoring.
 Pure Python implementation supporting complex workflow patterns.
 """
 
+import inspect
 import time
 import uuid
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
-from collections import defaultdict, deque
+from collections import deque
+from concurrent.futures import (ProcessPoolExecutor, ThreadPoolExecutor,
+                                FIRST_COMPLETED, wait)
 from enum import Enum
 import json
 import threading
 
+try:  # optional: JIT compilation for numeric map/reduce kernels
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+try:  # optional: C JSON serializer; json's indent path is pure Python
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # optional: readers-writer lock so concurrent pollers don't serialize
+    from readerwriterlock.rwlock import RWLockFair as _RWLockFair
+except ImportError:
+    _RWLockFair = None
+
 
 class TaskStatus(Enum):
     """Task status enumeration."""
@@ -25,73 +43,168 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
+# States a task can never leave; one frozenset probe per task in
+# is_complete instead of building a four-element list per check
+_TERMINAL_STATUSES = frozenset({
+    TaskStatus.COMPLETED, TaskStatus.FAILED,
+    TaskStatus.SKIPPED, TaskStatus.CANCELLED,
+})
+
+
+# Smallest homogeneous ready wave worth batch dispatch; below this the
+# grouping bookkeeping costs more than the per-task submissions it saves
+_BATCH_MIN = 8
+
+
+def _run_func_batch(func: Callable, args_list: List[Tuple]) -> List[Tuple[bool, Any]]:
+    """Run one homogeneous task batch, capturing per-task outcomes.
+
+    Module-level so process-mode workers receive one picklable
+    (func, args_list) payload per batch instead of one IPC round trip
+    per task.
+    """
+    results = []
+    for args in args_list:
+        try:
+            results.append((True, func(*args)))
+        except Exception as e:
+            results.append((False, str(e)))
+    return results
+
+
+def _accepts_dependencies(func: Callable) -> bool:
+    """Whether func can receive the _dependencies kwarg."""
+    try:
+        params = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return True  # uninspectable (builtins, C funcs): keep injecting
+    if '_dependencies' in params:
+        return True
+    return any(p.kind is inspect.Parameter.VAR_KEYWORD
+               for p in params.values())
+
+
 class Task:
     """Represents a task in a workflow."""
-    
+
+    # Slots halve per-instance memory (no __dict__) and make attribute
+    # reads a fixed offset; noticeable on very large workflows
+    __slots__ = ('task_id', 'func', 'args', 'kwargs', 'retry_count',
+                 'timeout', 'inject_deps', 'dependencies', 'dependents',
+                 '_dep_ids', 'status', 'result', 'error', 'retries_left',
+                 '_workflow', '_dep_results', 'started_at', 'completed_at')
+
     def __init__(self, task_id: str, func: Callable, args: Tuple = (), kwargs: Optional[Dict] = None,
-                 retry_count: int = 0, timeout: Optional[float] = None):
+                 retry_count: int = 0, timeout: Optional[float] = None,
+                 inject_deps: Optional[bool] = None):
         self.task_id = task_id
         self.func = func
         self.args = args
         self.kwargs = kwargs or {}
         self.retry_count = retry_count
         self.timeout = timeout
+        # Default: inspect the signature once at construction, so tasks
+        # whose funcs cannot take _dependencies skip the per-call dict
+        if inject_deps is None:
+            inject_deps = _accepts_dependencies(func)
+        self.inject_deps = inject_deps
         
         self.dependencies = []  # Tasks that must complete before this
         self.dependents = []  # Tasks that depend on this
+        self._dep_ids: Set[int] = set()  # id()s backing O(1) dedup above
         
         self.status = TaskStatus.PENDING
         self.result = None
         self.error = None
         self.retries_left = retry_count
+        self._workflow = None  # set by Workflow.add_task
+        self._dep_results = None  # precomputed by the scheduler at ready time
         
         self.started_at = None
         self.completed_at = None
     
     def add_dependency(self, task: 'Task'):
         """Add a task dependency."""
-        if task not in self.dependencies:
+        # Set membership instead of a list scan: building a dense DAG
+        # would otherwise cost O(deps) per add, O(N^2) overall
+        if id(task) not in self._dep_ids:
+            self._dep_ids.add(id(task))
             self.dependencies.append(task)
             task.dependents.append(self)
     
+    def _set_status(self, new_status: TaskStatus):
+        """Transition status, notifying the owning workflow if any.
+
+        All status writes in this module go through here so the
+        workflow can keep its cached statistics current.
+        """
+        workflow = self._workflow
+        if workflow is not None:
+            workflow._on_status_change(self.status, new_status)
+        self.status = new_status
+
     def can_run(self) -> bool:
         """Check if task is ready to run."""
-        if self.status != TaskStatus.PENDING:
+        if self.status is not TaskStatus.PENDING:
             return False
         
         # All dependencies must be completed
-        return all(dep.status == TaskStatus.COMPLETED for dep in self.dependencies)
+        # Identity compares: enum members are singletons, and `is`
+        # skips the Python-level __eq__ dispatch on this hot path
+        return all(dep.status is TaskStatus.COMPLETED for dep in self.dependencies)
     
-    def execute(self) -> bool:
-        """Execute the task. Returns True if successful."""
-        self.status = TaskStatus.RUNNING
-        self.started_at = time.time()
-        
+    def execute(self, state_lock: Optional[threading.Lock] = None) -> bool:
+        """Execute the task. Returns True if successful.
+
+        When running under an executor, pass its lock so status
+        transitions and result publication are atomic with respect to
+        readers on other threads.
+        """
+        lock = state_lock if state_lock is not None else threading.Lock()
+
+        with lock:
+            self._set_status(TaskStatus.RUNNING)
+            # monotonic_ns is one integer read with no float conversion
+            # (time.time can be a syscall); only stamped on the first
+            # attempt so retries keep the original start
+            if self.started_at is None:
+                self.started_at = time.monotonic_ns()
+
         try:
-            # Get results from dependencies
-            dep_results = {dep.task_id: dep.result for dep in self.dependencies}
-            
-            # Add dependency results to kwargs
-            kwargs = self.kwargs.copy()
-            if dep_results:
-                kwargs['_dependencies'] = dep_results
-            
-            self.result = self.func(*self.args, **kwargs)
-            self.status = TaskStatus.COMPLETED
-            self.completed_at = time.time()
+            if self.inject_deps and self.dependencies:
+                # Get results from dependencies, reusing the dict the
+                # scheduler precomputed at ready time when there is one
+                # (dependency results are final once we are runnable)
+                dep_results = self._dep_results
+                if dep_results is None:
+                    dep_results = {dep.task_id: dep.result
+                                   for dep in self.dependencies}
+                kwargs = {**self.kwargs, '_dependencies': dep_results}
+            else:
+                # execute never mutates kwargs, so the pass-through
+                # avoids a dict copy per invocation
+                kwargs = self.kwargs
+
+            result = self.func(*self.args, **kwargs)
+            with lock:
+                # Publish the result before flipping status so readers
+                # that see COMPLETED always see the result
+                self.result = result
+                self._set_status(TaskStatus.COMPLETED)
+                self.completed_at = time.monotonic_ns()
             return True
-            
+
         except Exception as e:
-            self.error = str(e)
-            
-            if self.retries_left > 0:
-                self.retries_left -= 1
-                self.status = TaskStatus.PENDING
-                return False
-            else:
-                self.status = TaskStatus.FAILED
-                self.completed_at = time.time()
-                return False
+            with lock:
+                self.error = str(e)
+
+                if self.retries_left > 0:
+                    self.retries_left -= 1
+                    self._set_status(TaskStatus.PENDING)
+                else:
+                    self._set_status(TaskStatus.FAILED)
+                    self.completed_at = time.monotonic_ns()
+            return False
     
     def to_dict(self) -> Dict:
         """Convert task to dictionary."""
@@ -101,18 +214,30 @@ class Task:
             'dependencies': [dep.task_id for dep in self.dependencies],
             'result': str(self.result) if self.result is not None else None,
             'error': self.error,
-            'started_at': self.started_at,
-            'completed_at': self.completed_at,
+            # timestamps are monotonic nanoseconds internally; exposed
+            # as float seconds so the serialized shape stays numeric
+            'started_at': self.started_at / 1e9 if self.started_at else None,
+            'completed_at': self.completed_at / 1e9 if self.completed_at else None,
             'retries_left': self.retries_left
         }
 
 
 class Workflow:
     """Workflow containing tasks and their dependencies (DAG)."""
-    
+
+    __slots__ = ('workflow_id', 'tasks', '_topo_order', '_status_version',
+                 '_status_counts', '_viz_cache', 'execution_order',
+                 'status', 'created_at', 'started_at', 'completed_at')
+
     def __init__(self, workflow_id: Optional[str] = None):
         self.workflow_id = workflow_id or str(uuid.uuid4())
         self.tasks = {}  # task_id -> Task
+        self._topo_order = None  # cached Kahn order, reset on mutation
+        # Bumped on every task status transition; caches keyed on it
+        # stay valid between transitions, so pollers pay O(1)
+        self._status_version = 0
+        self._status_counts = {s.value: 0 for s in TaskStatus}
+        self._viz_cache = (-1, None)
         self.execution_order = []
         self.status = "pending"
         self.created_at = time.time()
@@ -122,6 +247,16 @@ class Workflow:
     def add_task(self, task: Task):
         """Add a task to the workflow."""
         self.tasks[task.task_id] = task
+        task._workflow = self
+        self._status_counts[task.status.value] += 1
+        self._topo_order = None
+        self._status_version += 1
+
+    def _on_status_change(self, old_status: TaskStatus, new_status: TaskStatus):
+        """Roll the status counters on a task transition."""
+        self._status_counts[old_status.value] -= 1
+        self._status_counts[new_status.value] += 1
+        self._status_version += 1
     
     def add_task_from_func(self, task_id: str, func: Callable, dependencies: Optional[List[str]] = None,
                           args: Tuple = (), kwargs: Optional[Dict] = None, **task_kwargs) -> Task:
@@ -131,67 +266,64 @@ class Workflow:
         
         if dependencies:
             for dep_id in dependencies:
-                if dep_id in self.tasks:
-                    task.add_dependency(self.tasks[dep_id])
-        
+                # Single .get instead of membership test + lookup
+                dep = self.tasks.get(dep_id)
+                if dep is not None:
+                    task.add_dependency(dep)
+            self._topo_order = None
+
         return task
     
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a task by ID."""
         return self.tasks.get(task_id)
     
+    def _kahn_sort(self) -> List[str]:
+        """Compute a topological order with Kahn's algorithm.
+
+        On a cyclic graph the returned order is shorter than the task
+        count, which doubles as cycle detection without any recursion.
+        Tasks are numbered 0..n-1 so the hot loop works on flat integer
+        lists instead of per-edge dict lookups on task_id strings.
+        """
+        tasks = list(self.tasks.values())
+        index = {id(task): i for i, task in enumerate(tasks)}
+
+        in_degree = [len(task.dependencies) for task in tasks]
+        dependents_idx = [[index[id(d)] for d in task.dependents]
+                          for task in tasks]
+
+        # Queue of tasks with no dependencies
+        queue = deque([i for i, degree in enumerate(in_degree) if degree == 0])
+        order = []
+
+        while queue:
+            i = queue.popleft()
+            order.append(i)
+
+            for j in dependents_idx[i]:
+                in_degree[j] -= 1
+                if in_degree[j] == 0:
+                    queue.append(j)
+
+        return [tasks[i].task_id for i in order]
+
     def validate(self) -> Tuple[bool, Optional[str]]:
         """Validate workflow (check for cycles, orphans)."""
-        # Check for cycles using DFS
-        visited = set()
-        rec_stack = set()
-        
-        def has_cycle(task_id: str) -> bool:
-            visited.add(task_id)
-            rec_stack.add(task_id)
-            
-            task = self.tasks[task_id]
-            for dep in task.dependencies:
-                if dep.task_id not in visited:
-                    if has_cycle(dep.task_id):
-                        return True
-                elif dep.task_id in rec_stack:
-                    return True
-            
-            rec_stack.remove(task_id)
-            return False
-        
-        for task_id in self.tasks:
-            if task_id not in visited:
-                if has_cycle(task_id):
-                    return False, f"Cycle detected in workflow"
-        
+        # One linear Kahn pass detects cycles and yields the order the
+        # executors need next, so it is cached rather than discarded
+        order = self._kahn_sort()
+        if len(order) < len(self.tasks):
+            return False, f"Cycle detected in workflow"
+
+        self._topo_order = order
         return True, None
-    
+
     def topological_sort(self) -> List[str]:
         """Get tasks in topological order."""
-        in_degree = {task_id: 0 for task_id in self.tasks}
-        
-        # Calculate in-degrees
-        for task in self.tasks.values():
-            for dep in task.dependencies:
-                in_degree[task.task_id] += 1
-        
-        # Queue of tasks with no dependencies
-        queue = deque([task_id for task_id, degree in in_degree.items() if degree == 0])
-        sorted_tasks = []
-        
-        while queue:
-            task_id = queue.popleft()
-            sorted_tasks.append(task_id)
-            
-            task = self.tasks[task_id]
-            for dependent in task.dependents:
-                in_degree[dependent.task_id] -= 1
-                if in_degree[dependent.task_id] == 0:
-                    queue.append(dependent.task_id)
-        
-        return sorted_tasks
+        if self._topo_order is None:
+            self._topo_order = self._kahn_sort()
+        return list(self._topo_order)
     
     def get_ready_tasks(self) -> List[Task]:
         """Get all tasks that are ready to run."""
@@ -200,16 +332,16 @@ class Workflow:
     def is_complete(self) -> bool:
         """Check if workflow is complete."""
         return all(
-            task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.SKIPPED, TaskStatus.CANCELLED]
+            task.status in _TERMINAL_STATUSES
             for task in self.tasks.values()
         )
     
     def get_statistics(self) -> Dict:
         """Get workflow statistics."""
-        status_counts = defaultdict(int)
-        for task in self.tasks.values():
-            status_counts[task.status.value] += 1
-        
+        # Counters roll forward on every transition, so no per-call
+        # task scan; zero buckets are dropped to match the old shape
+        status_counts = {s: c for s, c in self._status_counts.items() if c}
+
         duration = None
         if self.started_at:
             end_time = self.completed_at or time.time()
@@ -219,7 +351,7 @@ class Workflow:
             'workflow_id': self.workflow_id,
             'status': self.status,
             'total_tasks': len(self.tasks),
-            'status_counts': dict(status_counts),
+            'status_counts': status_counts,
             'duration': duration,
             'created_at': self.created_at,
             'started_at': self.started_at,
@@ -237,18 +369,100 @@ class Workflow:
     
     def save(self, filepath: str):
         """Save workflow state to file."""
-        with open(filepath, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(self.to_dict(), f, indent=2)
 
 
 class WorkflowExecutor:
-    """Execute workflows with various strategies."""
-    
-    def __init__(self, max_parallel: int = 4):
+    """Execute workflows with various strategies.
+
+    mode="thread" (default) suits I/O-bound tasks; mode="process" runs
+    task functions in a ProcessPoolExecutor for genuine multi-core
+    parallelism on CPU-bound pure-Python work, at the cost that task
+    funcs, args, and results must be picklable.
+    """
+
+    def __init__(self, max_parallel: int = 4, mode: str = "thread"):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unknown executor mode: {mode}")
         self.max_parallel = max_parallel
+        self.mode = mode
         self.running_tasks = {}
         self.lock = threading.Lock()
+        self._running: Set[str] = set()  # task_ids currently on a worker
+        # Created once and reused across execute_parallel calls: worker
+        # threads pull from the pool's C-level SimpleQueue, so ready
+        # tasks cost an enqueue instead of a kernel thread spawn + join
+        if mode == "process":
+            self._pool = ProcessPoolExecutor(max_workers=max_parallel)
+        else:
+            self._pool = ThreadPoolExecutor(max_workers=max_parallel)
     
+    def _apply_future_result(self, task: Task, future) -> None:
+        """Mirror Task.execute's state handling for process-mode work.
+
+        The function ran in another process, so its outcome arrives via
+        the future and is folded back into the local Task here.
+        """
+        with self.lock:
+            error = future.exception()
+            if error is None:
+                task.result = future.result()
+                task._set_status(TaskStatus.COMPLETED)
+                task.completed_at = time.monotonic_ns()
+            else:
+                task.error = str(error)
+                if task.retries_left > 0:
+                    task.retries_left -= 1
+                    task._set_status(TaskStatus.PENDING)
+                else:
+                    task._set_status(TaskStatus.FAILED)
+                    task.completed_at = time.monotonic_ns()
+
+    def _run_batch(self, group: List[Task]) -> None:
+        """Execute a homogeneous batch on one worker thread."""
+        for task in group:
+            task.execute(self.lock)
+
+    def _apply_batch_results(self, group: List[Task], future) -> None:
+        """Demux _run_func_batch outcomes back onto their tasks."""
+        results = future.result()
+        with self.lock:
+            for task, (ok, value) in zip(group, results):
+                if ok:
+                    task.result = value
+                    task._set_status(TaskStatus.COMPLETED)
+                    task.completed_at = time.monotonic_ns()
+                else:
+                    task.error = value
+                    if task.retries_left > 0:
+                        task.retries_left -= 1
+                        task._set_status(TaskStatus.PENDING)
+                    else:
+                        task._set_status(TaskStatus.FAILED)
+                        task.completed_at = time.monotonic_ns()
+
+    def _cancel_descendants(self, task: Task) -> int:
+        """Cancel every still-pending task downstream of a failed one.
+
+        Returns the number of tasks cancelled. Without this the old
+        polling loop would spin forever: dependents of a failed task
+        never became ready and the workflow never completed.
+        """
+        cancelled = 0
+        stack = list(task.dependents)
+        while stack:
+            dependent = stack.pop()
+            if dependent.status is TaskStatus.PENDING:
+                dependent._set_status(TaskStatus.CANCELLED)
+                cancelled += 1
+                stack.extend(dependent.dependents)
+        return cancelled
+
     def execute_sequential(self, workflow: Workflow) -> bool:
         """Execute workflow tasks sequentially."""
         valid, error = workflow.validate()
@@ -282,33 +496,167 @@ class WorkflowExecutor:
         workflow.status = "running"
         workflow.started_at = time.time()
         
-        threads = []
-        
-        while not workflow.is_complete():
-            ready_tasks = workflow.get_ready_tasks()
-            
-            if not ready_tasks:
-                # Wait for running tasks
-                time.sleep(0.1)
-                continue
-            
-            # Mark tasks as ready
-            for task in ready_tasks:
-                task.status = TaskStatus.READY
-            
-            # Execute up to max_parallel tasks
-            for task in ready_tasks[:self.max_parallel]:
-                thread = threading.Thread(target=task.execute)
-                thread.start()
-                threads.append(thread)
-            
-            # Wait for batch to complete
-            for thread in threads:
-                thread.join()
-            threads.clear()
-        
+        # Streaming Kahn scheduling: track in-degrees and submit a task
+        # the moment its last dependency clears, so the total scheduling
+        # work is O(V+E) rather than O(V*(V+E)). The bookkeeping lives
+        # in flat integer arrays indexed by task number (same layout as
+        # _kahn_sort) so per-edge work touches compact lists instead of
+        # chasing Task objects scattered across the heap
+        tasks = list(workflow.tasks.values())
+        index = {id(task): i for i, task in enumerate(tasks)}
+        in_degree = [len(task.dependencies) for task in tasks]
+        dependents_idx = [[index[id(d)] for d in task.dependents]
+                          for task in tasks]
+
+        futures = {}
+
+        def submit(task):
+            # Built once per task, not per attempt: retries and
+            # high-fanin aggregates reuse it since dependency results
+            # are immutable by the time a task is runnable. Tasks that
+            # neither inject deps nor gate on a condition skip it
+            if task._dep_results is None and (
+                    task.inject_deps or isinstance(task, ConditionalTask)):
+                task._dep_results = {d.task_id: d.result
+                                     for d in task.dependencies}
+            with self.lock:
+                task._set_status(TaskStatus.READY)
+                self._running.add(task.task_id)
+            if self.mode == "process":
+                # Task objects hold locks and backrefs, so only the
+                # picklable func/args cross the process boundary; state
+                # is reconstructed on this side when the future lands.
+                # Conditions take only the parent-side results dict, so
+                # gate here instead of in the worker - otherwise a
+                # ConditionalTask's predicate would never run at all
+                if isinstance(task, ConditionalTask):
+                    try:
+                        should_run = task.condition(task._dep_results or {})
+                    except Exception as e:
+                        with self.lock:
+                            task.error = f"Condition evaluation failed: {e}"
+                            task._set_status(TaskStatus.FAILED)
+                        settle(task)
+                        return
+                    if not should_run:
+                        with self.lock:
+                            task._set_status(TaskStatus.SKIPPED)
+                            task.completed_at = time.monotonic_ns()
+                        settle(task)
+                        return
+                if task.inject_deps and task._dep_results:
+                    kwargs = {**task.kwargs, '_dependencies': task._dep_results}
+                else:
+                    kwargs = task.kwargs
+                with self.lock:
+                    task._set_status(TaskStatus.RUNNING)
+                    if task.started_at is None:
+                        task.started_at = time.monotonic_ns()
+                futures[self._pool.submit(task.func, *task.args, **kwargs)] = task
+            else:
+                futures[self._pool.submit(task.execute, self.lock)] = task
+
+        def submit_batch(group):
+            # One dispatch for a homogeneous fanout slice: templates
+            # like create_map_reduce produce hundreds of same-func
+            # siblings that would otherwise each pay submission cost
+            with self.lock:
+                for task in group:
+                    task._set_status(TaskStatus.READY)
+                    self._running.add(task.task_id)
+            if self.mode == "process":
+                with self.lock:
+                    for task in group:
+                        task._set_status(TaskStatus.RUNNING)
+                        if task.started_at is None:
+                            task.started_at = time.monotonic_ns()
+                future = self._pool.submit(_run_func_batch, group[0].func,
+                                           [task.args for task in group])
+            else:
+                future = self._pool.submit(self._run_batch, group)
+            futures[future] = group
+
+        def dispatch(wave):
+            # Split a ready wave into homogeneous batches and singles.
+            # Eligible: plain Tasks sharing one func, positional args
+            # only, no dependency injection - exactly the shape the
+            # fanout templates emit
+            if len(wave) < _BATCH_MIN:
+                for task in wave:
+                    submit(task)
+                return
+            groups = {}
+            singles = []
+            for task in wave:
+                if (type(task) is Task and not task.inject_deps
+                        and not task.kwargs):
+                    groups.setdefault(id(task.func), []).append(task)
+                else:
+                    singles.append(task)
+            for group in groups.values():
+                if len(group) < _BATCH_MIN:
+                    singles.extend(group)
+                    continue
+                # Spread the batch over the pool in max_parallel slices
+                chunk = -(-len(group) // self.max_parallel)
+                for start in range(0, len(group), chunk):
+                    submit_batch(group[start:start + chunk])
+            for task in singles:
+                submit(task)
+
+        newly_ready = []
+
+        def settle(task):
+            with self.lock:
+                self._running.discard(task.task_id)
+                status = task.status
+            if status is TaskStatus.PENDING:
+                # Failed with retries left; its worker has exited
+                # (future resolved), so resubmission cannot race a
+                # still-running attempt
+                submit(task)
+            elif status is TaskStatus.FAILED:
+                self._cancel_descendants(task)
+            else:
+                # COMPLETED (or SKIPPED conditional)
+                for j in dependents_idx[index[id(task)]]:
+                    in_degree[j] -= 1
+                    if in_degree[j] == 0:
+                        newly_ready.append(tasks[j])
+
+        def drain():
+            # Skipped conditionals settle synchronously inside dispatch
+            # (no worker involved), so freed dependents can cascade
+            # without any future resolving
+            while newly_ready:
+                wave = newly_ready.copy()
+                newly_ready.clear()
+                dispatch(wave)
+
+        dispatch([tasks[i] for i, degree in enumerate(in_degree)
+                  if degree == 0])
+        drain()
+
+        # Event-driven: each completion immediately frees its
+        # dependents - no batch barrier idling fast workers while
+        # the slowest task of a batch finishes
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                entry = futures.pop(future)
+                if isinstance(entry, list):
+                    if self.mode == "process":
+                        self._apply_batch_results(entry, future)
+                    for task in entry:
+                        settle(task)
+                else:
+                    if self.mode == "process":
+                        self._apply_future_result(entry, future)
+                    settle(entry)
+            drain()
+
         # Check if any tasks failed
-        failed_tasks = [t for t in workflow.tasks.values() if t.status == TaskStatus.FAILED]
+        failed_tasks = [t for t in workflow.tasks.values() if t.status is TaskStatus.FAILED]
         
         if failed_tasks:
             workflow.status = "failed"
@@ -353,35 +701,45 @@ class WorkflowExecutor:
 
 class ConditionalTask(Task):
     """Task that runs conditionally based on a predicate."""
-    
+
+    __slots__ = ('condition',)
+
     def __init__(self, task_id: str, func: Callable, condition: Callable,
                  args: Tuple = (), kwargs: Optional[Dict] = None, **task_kwargs):
         super().__init__(task_id, func, args, kwargs, **task_kwargs)
         self.condition = condition
     
-    def execute(self) -> bool:
+    def execute(self, state_lock: Optional[threading.Lock] = None) -> bool:
         """Execute task only if condition is met."""
-        # Evaluate condition
-        dep_results = {dep.task_id: dep.result for dep in self.dependencies}
-        
+        lock = state_lock if state_lock is not None else threading.Lock()
+
+        # Evaluate condition against the same cached dict execute uses
+        dep_results = self._dep_results
+        if dep_results is None:
+            dep_results = {dep.task_id: dep.result for dep in self.dependencies}
+
         try:
             should_run = self.condition(dep_results)
         except Exception as e:
-            self.error = f"Condition evaluation failed: {e}"
-            self.status = TaskStatus.FAILED
+            with lock:
+                self.error = f"Condition evaluation failed: {e}"
+                self._set_status(TaskStatus.FAILED)
             return False
-        
+
         if not should_run:
-            self.status = TaskStatus.SKIPPED
-            self.completed_at = time.time()
+            with lock:
+                self._set_status(TaskStatus.SKIPPED)
+                self.completed_at = time.monotonic_ns()
             return True
-        
-        return super().execute()
+
+        return super().execute(state_lock)
 
 
 class ParallelTaskGroup:
     """Group of tasks that run in parallel."""
-    
+
+    __slots__ = ('group_id', 'tasks')
+
     def __init__(self, group_id: str):
         self.group_id = group_id
         self.tasks = []
@@ -390,31 +748,51 @@ class ParallelTaskGroup:
         """Add a task to the group."""
         self.tasks.append(task)
     
-    def execute(self) -> bool:
-        """Execute all tasks in parallel."""
-        threads = []
-        
-        for task in self.tasks:
-            thread = threading.Thread(target=task.execute)
-            thread.start()
-            threads.append(thread)
-        
-        for thread in threads:
-            thread.join()
-        
+    def execute(self, executor: Optional[WorkflowExecutor] = None) -> bool:
+        """Execute all tasks in parallel.
+
+        Reuses the executor's worker pool when one is given, avoiding a
+        fresh kernel thread per task for large groups.
+        """
+        if executor is not None and executor.mode == "thread":
+            futures = [executor._pool.submit(task.execute, executor.lock)
+                       for task in self.tasks]
+            wait(futures)
+        else:
+            with ThreadPoolExecutor(max_workers=len(self.tasks) or 1) as pool:
+                wait([pool.submit(task.execute) for task in self.tasks])
+
         # Return True if all succeeded
-        return all(task.status == TaskStatus.COMPLETED for task in self.tasks)
+        return all(task.status is TaskStatus.COMPLETED for task in self.tasks)
 
 
 class WorkflowTemplate:
     """Template for creating workflows with common patterns."""
     
     @staticmethod
-    def create_map_reduce(map_func: Callable, reduce_func: Callable, 
-                         inputs: List[Any]) -> Workflow:
-        """Create a map-reduce workflow."""
+    def create_map_reduce(map_func: Callable, reduce_func: Callable,
+                         inputs: List[Any], jit: bool = False) -> Workflow:
+        """Create a map-reduce workflow.
+
+        With jit=True and numba installed, map_func and reduce_func are
+        compiled with njit(cache=True, nogil=True): both must be
+        nopython-compatible (numeric scalars/arrays only), and because
+        the dependency-result dict is not, a jitted reduce_func is
+        called with the map results as a plain list instead of the
+        usual _dependencies dict. Releasing the GIL lets
+        execute_parallel run map tasks on real cores instead of
+        time-slicing them; the engine itself stays pure Python since
+        JIT only pays off inside numeric kernels.
+        """
         workflow = Workflow()
-        
+
+        if jit and _njit is not None:
+            map_func = _njit(cache=True, nogil=True)(map_func)
+            reduce_kernel = _njit(cache=True, nogil=True)(reduce_func)
+
+            def reduce_func(_dependencies=None):
+                return reduce_kernel(list((_dependencies or {}).values()))
+
         # Create map tasks
         map_tasks = []
         for i, inp in enumerate(inputs):
@@ -482,23 +860,34 @@ class WorkflowMonitor:
     def __init__(self):
         self.workflows = {}
         self.lock = threading.Lock()
-    
+        # Status reads vastly outnumber registrations, so pollers take
+        # a shared read lock when the backend is available and only
+        # register/cleanup writers exclude each other; without the
+        # package both sides degrade to the plain mutex above
+        if _RWLockFair is not None:
+            rw = _RWLockFair()
+            self._rlock = rw.gen_rlock
+            self._wlock = rw.gen_wlock
+        else:
+            self._rlock = lambda: self.lock
+            self._wlock = lambda: self.lock
+
     def register_workflow(self, workflow: Workflow):
         """Register a workflow for monitoring."""
-        with self.lock:
+        with self._wlock():
             self.workflows[workflow.workflow_id] = workflow
-    
+
     def get_workflow_status(self, workflow_id: str) -> Optional[Dict]:
         """Get current status of a workflow."""
-        with self.lock:
+        with self._rlock():
             workflow = self.workflows.get(workflow_id)
             if workflow:
                 return workflow.get_statistics()
         return None
-    
+
     def get_all_workflows(self) -> Dict[str, Dict]:
         """Get status of all workflows."""
-        with self.lock:
+        with self._rlock():
             return {
                 wf_id: wf.get_statistics()
                 for wf_id, wf in self.workflows.items()
@@ -506,41 +895,62 @@ class WorkflowMonitor:
     
     def cleanup_completed(self):
         """Remove completed workflows from monitoring."""
-        with self.lock:
-            completed = [
-                wf_id for wf_id, wf in self.workflows.items()
-                if wf.is_complete()
-            ]
+        # Snapshot under the lock, evaluate completion outside it (task
+        # state only moves toward terminal, so a stale read just defers
+        # the removal to the next sweep), then reacquire to delete -
+        # keeps readers from blocking behind N is_complete scans
+        with self._rlock():
+            snapshot = list(self.workflows.items())
+
+        completed = [wf_id for wf_id, wf in snapshot if wf.is_complete()]
+
+        with self._wlock():
             for wf_id in completed:
-                del self.workflows[wf_id]
+                self.workflows.pop(wf_id, None)
+
+
+# Hoisted so visualize_workflow doesn't rebuild the mapping per task
+_STATUS_SYMBOL = {
+    TaskStatus.PENDING: "⏸",
+    TaskStatus.READY: "▶",
+    TaskStatus.RUNNING: "⚙",
+    TaskStatus.COMPLETED: "✓",
+    TaskStatus.FAILED: "✗",
+    TaskStatus.SKIPPED: "⊘",
+    TaskStatus.CANCELLED: "⊗",
+}
 
 
 def visualize_workflow(workflow: Workflow) -> str:
     """Create a text visualization of the workflow DAG."""
-    lines = [f"Workflow: {workflow.workflow_id}"]
-    lines.append("=" * 50)
-    
-    # Topological sort for display order
+    # Rendered text only changes when a task changes status, so reuse
+    # the last rendering while the status version is unchanged
+    version, cached = workflow._viz_cache
+    if version == workflow._status_version and cached is not None:
+        return cached
+
+    # Topological sort for display order (cached on the workflow)
     sorted_tasks = workflow.topological_sort()
-    
-    for task_id in sorted_tasks:
-        task = workflow.get_task(task_id)
-        status_symbol = {
-            TaskStatus.PENDING: "⏸",
-            TaskStatus.READY: "▶",
-            TaskStatus.RUNNING: "⚙",
-            TaskStatus.COMPLETED: "✓",
-            TaskStatus.FAILED: "✗",
-            TaskStatus.SKIPPED: "⊘",
-            TaskStatus.CANCELLED: "⊗"
-        }.get(task.status, "?")
-        
+
+    # Preallocated and filled by index: no list growth while rendering
+    lines = [None] * (len(sorted_tasks) + 2)
+    lines[0] = f"Workflow: {workflow.workflow_id}"
+    lines[1] = "=" * 50
+
+    get_symbol = _STATUS_SYMBOL.get
+    tasks = workflow.tasks
+    for i, task_id in enumerate(sorted_tasks):
+        task = tasks[task_id]
+        status_symbol = get_symbol(task.status, "?")
+
         indent = len(task.dependencies) * 2
         deps_str = f" <- [{', '.join(d.task_id for d in task.dependencies)}]" if task.dependencies else ""
-        
-        lines.append(f"{' ' * indent}{status_symbol} {task_id}{deps_str}")
-    
-    return "\n".join(lines)
+
+        lines[i + 2] = f"{' ' * indent}{status_symbol} {task_id}{deps_str}"
+
+    text = "\n".join(lines)
+    workflow._viz_cache = (workflow._status_version, text)
+    return text
 
 
 __all__ = [
@@ -5,7 +5,144 @@ Color conversions, manipulations, and calculations.
 """
 
 import math
-from typing import Tuple
+from functools import lru_cache
+from typing import List, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+# JIT-compiled twins of the per-pixel converters: the arithmetic is
+# pure-numeric, so njit removes the interpreter overhead that dominates
+# each call. cache=True persists the compile across processes; without
+# numba the pure-Python bodies below run unchanged.
+if _njit is not None:
+    @_njit(cache=True, fastmath=True)
+    def _rgb_to_hsl_jit(r, g, b):
+        r, g, b = r / 255, g / 255, b / 255
+        max_val = max(r, g, b)
+        min_val = min(r, g, b)
+        diff = max_val - min_val
+        l = (max_val + min_val) / 2
+        if diff == 0:
+            return 0.0, 0.0, l
+        if l > 0.5:
+            s = diff / (2 - max_val - min_val)
+        else:
+            s = diff / (max_val + min_val)
+        if max_val == r:
+            h = ((g - b) / diff + (6 if g < b else 0)) / 6
+        elif max_val == g:
+            h = ((b - r) / diff + 2) / 6
+        else:
+            h = ((r - g) / diff + 4) / 6
+        return h * 360, s, l
+
+    @_njit(cache=True, fastmath=True)
+    def _hsl_to_rgb_jit(h, s, l):
+        if s == 0:
+            v = int(l * 255)
+            return v, v, v
+        h = h / 360
+        q = l * (1 + s) if l < 0.5 else l + s - l * s
+        p = 2 * l - q
+        out_r = 0.0
+        out_g = 0.0
+        out_b = 0.0
+        for channel in range(3):
+            t = h + (1 - channel) / 3
+            if t < 0:
+                t += 1
+            if t > 1:
+                t -= 1
+            if t < 1 / 6:
+                c = p + (q - p) * 6 * t
+            elif t < 1 / 2:
+                c = q
+            elif t < 2 / 3:
+                c = p + (q - p) * (2 / 3 - t) * 6
+            else:
+                c = p
+            if channel == 0:
+                out_r = c
+            elif channel == 1:
+                out_g = c
+            else:
+                out_b = c
+        return int(out_r * 255), int(out_g * 255), int(out_b * 255)
+
+    @_njit(cache=True, fastmath=True)
+    def _rgb_to_hsv_jit(r, g, b):
+        r, g, b = r / 255, g / 255, b / 255
+        max_val = max(r, g, b)
+        min_val = min(r, g, b)
+        diff = max_val - min_val
+        s = 0.0 if max_val == 0 else diff / max_val
+        if diff == 0:
+            h = 0.0
+        elif max_val == r:
+            h = ((g - b) / diff + (6 if g < b else 0)) / 6
+        elif max_val == g:
+            h = ((b - r) / diff + 2) / 6
+        else:
+            h = ((r - g) / diff + 4) / 6
+        return h * 360, s, max_val
+
+    @_njit(cache=True, fastmath=True)
+    def _hsv_to_rgb_jit(h, s, v):
+        h = h / 60
+        i = int(h)
+        f = h - i
+        p = v * (1 - s)
+        q = v * (1 - s * f)
+        t = v * (1 - s * (1 - f))
+        i = i % 6
+        if i == 0:
+            r, g, b = v, t, p
+        elif i == 1:
+            r, g, b = q, v, p
+        elif i == 2:
+            r, g, b = p, v, t
+        elif i == 3:
+            r, g, b = p, q, v
+        elif i == 4:
+            r, g, b = t, p, v
+        else:
+            r, g, b = v, p, q
+        return int(r * 255), int(g * 255), int(b * 255)
+
+else:
+    _rgb_to_hsl_jit = None
+    _hsl_to_rgb_jit = None
+    _rgb_to_hsv_jit = None
+    _hsv_to_rgb_jit = None
+
+# sRGB gamma linearization for every possible channel value, computed
+# once at import: the ((c + 0.055) / 1.055) ** 2.4 pow dominates
+# luminance cost, and inputs are always integers 0-255.
+_SRGB_LIN = tuple(
+    (c / 255 / 12.92) if c / 255 <= 0.03928
+    else ((c / 255 + 0.055) / 1.055) ** 2.4
+    for c in range(256)
+)
+_SRGB_LIN_ARR = np.array(_SRGB_LIN) if np is not None else None
+
+# Colorspace transforms that are per-pixel weighted sums become one
+# matrix product over the whole image in the batch variants below.
+if np is not None:
+    _SEPIA_MATRIX = np.array([[0.393, 0.769, 0.189],
+                              [0.349, 0.686, 0.168],
+                              [0.272, 0.534, 0.131]], dtype=np.float32)
+    _GRAY_WEIGHTS = np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+else:
+    _SEPIA_MATRIX = None
+    _GRAY_WEIGHTS = None
 
 
 def rgb_to_hex(r: int, g: int, b: int) -> str:
@@ -42,7 +179,10 @@ def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
         (255, 0, 0)
     """
     hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    if len(hex_color) == 3:  # shorthand like 'f00'
+        hex_color = ''.join(c * 2 for c in hex_color)
+    # One C-level decode instead of three int(..., 16) parser calls
+    return tuple(bytes.fromhex(hex_color))
 
 
 def rgb_to_hsl(r: int, g: int, b: int) -> Tuple[float, float, float]:
@@ -62,6 +202,9 @@ def rgb_to_hsl(r: int, g: int, b: int) -> Tuple[float, float, float]:
         >>> abs(h - 0) < 1 and abs(s - 1) < 0.01
         True
     """
+    if _rgb_to_hsl_jit is not None:
+        return _rgb_to_hsl_jit(r, g, b)
+
     r, g, b = r / 255, g / 255, b / 255
     
     max_val = max(r, g, b)
@@ -106,30 +249,51 @@ def hsl_to_rgb(h: float, s: float, l: float) -> Tuple[int, int, int]:
         >>> hsl_to_rgb(0, 1, 0.5)
         (255, 0, 0)
     """
+    if _hsl_to_rgb_jit is not None:
+        return _hsl_to_rgb_jit(h, s, l)
+
     h = h / 360
-    
-    def hue_to_rgb(p, q, t):
-        if t < 0:
-            t += 1
-        if t > 1:
-            t -= 1
-        if t < 1/6:
-            return p + (q - p) * 6 * t
-        if t < 1/2:
-            return q
-        if t < 2/3:
-            return p + (q - p) * (2/3 - t) * 6
-        return p
-    
+
     if s == 0:
         r = g = b = l
     else:
+        # Straight-line expansion of the usual hue_to_rgb helper: no
+        # closure allocation or per-channel call, q - p hoisted once,
+        # and % 1.0 replaces the wrap-around ifs
         q = l * (1 + s) if l < 0.5 else l + s - l * s
         p = 2 * l - q
-        r = hue_to_rgb(p, q, h + 1/3)
-        g = hue_to_rgb(p, q, h)
-        b = hue_to_rgb(p, q, h - 1/3)
-    
+        q_minus_p = q - p
+
+        t = (h + 1/3) % 1.0
+        if t < 1/6:
+            r = p + q_minus_p * 6 * t
+        elif t < 1/2:
+            r = q
+        elif t < 2/3:
+            r = p + q_minus_p * (2/3 - t) * 6
+        else:
+            r = p
+
+        t = h % 1.0
+        if t < 1/6:
+            g = p + q_minus_p * 6 * t
+        elif t < 1/2:
+            g = q
+        elif t < 2/3:
+            g = p + q_minus_p * (2/3 - t) * 6
+        else:
+            g = p
+
+        t = (h - 1/3) % 1.0
+        if t < 1/6:
+            b = p + q_minus_p * 6 * t
+        elif t < 1/2:
+            b = q
+        elif t < 2/3:
+            b = p + q_minus_p * (2/3 - t) * 6
+        else:
+            b = p
+
     return int(r * 255), int(g * 255), int(b * 255)
 
 
@@ -150,6 +314,9 @@ def rgb_to_hsv(r: int, g: int, b: int) -> Tuple[float, float, float]:
         >>> abs(h - 0) < 1 and abs(v - 1) < 0.01
         True
     """
+    if _rgb_to_hsv_jit is not None:
+        return _rgb_to_hsv_jit(r, g, b)
+
     r, g, b = r / 255, g / 255, b / 255
     
     max_val = max(r, g, b)
@@ -162,18 +329,19 @@ def rgb_to_hsv(r: int, g: int, b: int) -> Tuple[float, float, float]:
     # Saturation
     s = 0 if max_val == 0 else diff / max_val
     
-    # Hue
+    # Hue: compute all three sector candidates and pick by the index
+    # of the max channel instead of chaining float-equality branches.
+    # r wins ties with g and b, then g with b — same precedence as the
+    # old max_val == r / == g chain.
     if diff == 0:
         h = 0
-    elif max_val == r:
-        h = ((g - b) / diff + (6 if g < b else 0)) / 6
-    elif max_val == g:
-        h = ((b - r) / diff + 2) / 6
     else:
-        h = ((r - g) / diff + 4) / 6
-    
-    h *= 360
-    
+        mx_idx = 0 if r >= g and r >= b else (1 if g >= b else 2)
+        hue_candidates = ((g - b) / diff % 6,
+                          (b - r) / diff + 2,
+                          (r - g) / diff + 4)
+        h = hue_candidates[mx_idx] / 6 * 360
+
     return h, s, v
 
 
@@ -193,6 +361,9 @@ def hsv_to_rgb(h: float, s: float, v: float) -> Tuple[int, int, int]:
         >>> hsv_to_rgb(0, 1, 1)
         (255, 0, 0)
     """
+    if _hsv_to_rgb_jit is not None:
+        return _hsv_to_rgb_jit(h, s, v)
+
     h = h / 60
     i = int(h)
     f = h - i
@@ -254,11 +425,7 @@ def color_luminance(r: int, g: int, b: int) -> float:
         >>> color_luminance(255, 255, 255)
         1.0
     """
-    def adjust(c):
-        c = c / 255
-        return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
-    
-    return 0.2126 * adjust(r) + 0.7152 * adjust(g) + 0.0722 * adjust(b)
+    return 0.2126 * _SRGB_LIN[r] + 0.7152 * _SRGB_LIN[g] + 0.0722 * _SRGB_LIN[b]
 
 
 def contrast_ratio(rgb1: Tuple[int, int, int], rgb2: Tuple[int, int, int]) -> float:
@@ -420,10 +587,13 @@ def desaturate_color(r: int, g: int, b: int, amount: float) -> Tuple[int, int, i
     return hsl_to_rgb(h, s, l)
 
 
+# Pure function of a small-range integer, so memoize: repeated lookups
+# (temperature sliders, per-frame white balance) skip the log/pow math.
+@lru_cache(maxsize=4096)
 def color_temperature(kelvin: int) -> Tuple[int, int, int]:
     """
     Convert color temperature (Kelvin) to RGB
-    
+
     Args:
         kelvin: Temperature (1000-40000)
         
@@ -546,12 +716,14 @@ def nearest_web_safe_color(r: int, g: int, b: int) -> Tuple[int, int, int]:
         >>> nearest_web_safe_color(100, 100, 100)
         (102, 102, 102)
     """
-    web_safe_values = [0, 51, 102, 153, 204, 255]
-    
-    def nearest(val):
-        return min(web_safe_values, key=lambda x: abs(x - val))
-    
-    return nearest(r), nearest(g), nearest(b)
+    # The web-safe grid is uniform multiples of 51, so rounding to the
+    # nearest entry is a branchless integer formula instead of a
+    # min(..., key=abs) scan per channel
+    return (
+        ((r * 5 + 127) // 255) * 51,
+        ((g * 5 + 127) // 255) * 51,
+        ((b * 5 + 127) // 255) * 51,
+    )
 
 
 def rgba_to_rgb(r: int, g: int, b: int, a: float, bg_r: int = 255, bg_g: int = 255, bg_b: int = 255) -> Tuple[int, int, int]:
@@ -577,6 +749,316 @@ def rgba_to_rgb(r: int, g: int, b: int, a: float, bg_r: int = 255, bg_g: int = 2
     return r_out, g_out, b_out
 
 
+# Batch variants: one vectorized pass over (..., 3) arrays instead of a
+# Python call per pixel. Without numpy they degrade to mapping the
+# scalar converter over an iterable of pixels.
+
+def hex_array_to_rgb(hex_colors: List[str]):
+    """
+    Convert a batch of hex colors to RGB
+
+    Args:
+        hex_colors: List of hex color strings (with or without #)
+
+    Returns:
+        (N, 3) uint8 array (list of tuples without numpy)
+
+    Example:
+        >>> rgb = hex_array_to_rgb(['#FF0000', '#00FF00'])
+        >>> tuple(int(x) for x in rgb[0])
+        (255, 0, 0)
+    """
+    if np is None:
+        return [hex_to_rgb(h) for h in hex_colors]
+
+    raw = b''.join(bytes.fromhex(h[1:] if h.startswith('#') else h)
+                   for h in hex_colors)
+    return np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3)
+
+
+def rgb_to_hsl_array(pixels):
+    """
+    Convert a batch of RGB pixels to HSL
+
+    Args:
+        pixels: (..., 3) array (or iterable of (r, g, b)) with 0-255 channels
+
+    Returns:
+        (..., 3) float array of (h, s, l) with h 0-360, s and l 0-1
+        (list of tuples without numpy)
+
+    Example:
+        >>> hsl = rgb_to_hsl_array([(255, 0, 0)])
+        >>> tuple(round(float(x), 2) for x in hsl[0])
+        (0.0, 1.0, 0.5)
+    """
+    if np is None:
+        return [rgb_to_hsl(*px) for px in pixels]
+
+    a = np.asarray(pixels, dtype=np.float64) / 255.0
+    r, g, b = a[..., 0], a[..., 1], a[..., 2]
+    mx = a.max(axis=-1)
+    mn = a.min(axis=-1)
+    diff = mx - mn
+    nz = diff != 0
+
+    l = (mx + mn) / 2
+
+    s = np.zeros_like(l)
+    np.divide(diff, np.where(l > 0.5, 2 - mx - mn, mx + mn), out=s, where=nz)
+
+    # All three hue candidates, selected by which channel is the max
+    # (same precedence as the scalar branch chain: r, then g, then b)
+    d = np.where(nz, diff, 1.0)
+    h = np.select([mx == r, mx == g],
+                  [np.mod((g - b) / d, 6.0), (b - r) / d + 2.0],
+                  default=(r - g) / d + 4.0)
+    h = np.where(nz, h * 60.0, 0.0)
+
+    return np.stack([h, s, l], axis=-1)
+
+
+def rgb_to_hsv_array(pixels):
+    """
+    Convert a batch of RGB pixels to HSV
+
+    Args:
+        pixels: (..., 3) array (or iterable of (r, g, b)) with 0-255 channels
+
+    Returns:
+        (..., 3) float array of (h, s, v) with h 0-360, s and v 0-1
+        (list of tuples without numpy)
+
+    Example:
+        >>> hsv = rgb_to_hsv_array([(255, 0, 0)])
+        >>> tuple(round(float(x), 2) for x in hsv[0])
+        (0.0, 1.0, 1.0)
+    """
+    if np is None:
+        return [rgb_to_hsv(*px) for px in pixels]
+
+    a = np.asarray(pixels, dtype=np.float64) / 255.0
+    r, g, b = a[..., 0], a[..., 1], a[..., 2]
+    mx = a.max(axis=-1)
+    diff = mx - a.min(axis=-1)
+    nz = diff != 0
+
+    s = np.zeros_like(mx)
+    np.divide(diff, mx, out=s, where=mx != 0)
+
+    d = np.where(nz, diff, 1.0)
+    h = np.select([mx == r, mx == g],
+                  [np.mod((g - b) / d, 6.0), (b - r) / d + 2.0],
+                  default=(r - g) / d + 4.0)
+    h = np.where(nz, h * 60.0, 0.0)
+
+    return np.stack([h, s, mx], axis=-1)
+
+
+def hsv_to_rgb_array(pixels):
+    """
+    Convert a batch of HSV pixels to RGB
+
+    Args:
+        pixels: (..., 3) array (or iterable of (h, s, v)) with h 0-360,
+                s and v 0-1
+
+    Returns:
+        (..., 3) uint8 array (list of tuples without numpy)
+
+    Example:
+        >>> rgb = hsv_to_rgb_array([(0, 1, 1)])
+        >>> tuple(int(x) for x in rgb[0])
+        (255, 0, 0)
+    """
+    if np is None:
+        return [hsv_to_rgb(*px) for px in pixels]
+
+    a = np.asarray(pixels, dtype=np.float64)
+    h = a[..., 0] / 60.0
+    s = a[..., 1]
+    v = a[..., 2]
+
+    i = np.floor(h).astype(np.int64)
+    f = h - i
+    i %= 6
+
+    p = v * (1 - s)
+    q = v * (1 - s * f)
+    t = v * (1 - s * (1 - f))
+
+    # Sector tables mirror the scalar if/elif ladder
+    r = np.choose(i, [v, q, p, p, t, v])
+    g = np.choose(i, [t, v, v, q, p, p])
+    b = np.choose(i, [p, p, t, v, v, q])
+
+    return (np.stack([r, g, b], axis=-1) * 255).astype(np.uint8)
+
+
+def blend_colors_array(pixels1, pixels2, alpha: float = 0.5):
+    """
+    Blend two batches of colors with alpha
+
+    Args:
+        pixels1: (..., 3) array (or iterable of (r, g, b))
+        pixels2: (..., 3) array of the same shape
+        alpha: Blend factor (0-1, 0=all pixels1, 1=all pixels2)
+
+    Returns:
+        (..., 3) uint8 array (list of tuples without numpy)
+
+    Example:
+        >>> out = blend_colors_array([(255, 0, 0)], [(0, 0, 255)])
+        >>> tuple(int(x) for x in out[0])
+        (127, 0, 127)
+    """
+    if np is None:
+        return [blend_colors(p1, p2, alpha)
+                for p1, p2 in zip(pixels1, pixels2)]
+
+    a1 = np.asarray(pixels1, dtype=np.float64)
+    a2 = np.asarray(pixels2, dtype=np.float64)
+    return (a1 * (1 - alpha) + a2 * alpha).astype(np.uint8)
+
+
+def sepia_tone_array(pixels):
+    """
+    Apply sepia tone to a batch of colors
+
+    Args:
+        pixels: (..., 3) array (or iterable of (r, g, b)) with 0-255 channels
+
+    Returns:
+        (..., 3) uint8 array (list of tuples without numpy)
+
+    Example:
+        >>> out = sepia_tone_array([(255, 255, 255)])
+        >>> tuple(int(x) for x in out[0])
+        (255, 255, 239)
+    """
+    if np is None:
+        return [sepia_tone(*px) for px in pixels]
+
+    # One BLAS matmul instead of nine Python multiplies per pixel
+    out = np.asarray(pixels, dtype=np.float32) @ _SEPIA_MATRIX.T
+    np.clip(out, 0, 255, out=out)
+    return out.astype(np.uint8)
+
+
+def rgb_to_grayscale_array(pixels):
+    """
+    Convert a batch of colors to grayscale using luminosity method
+
+    Args:
+        pixels: (..., 3) array (or iterable of (r, g, b)) with 0-255 channels
+
+    Returns:
+        (...,) uint8 array of gray values (list of ints without numpy)
+
+    Example:
+        >>> gray = rgb_to_grayscale_array([(255, 0, 0)])
+        >>> int(gray[0])
+        54
+    """
+    if np is None:
+        return [rgb_to_grayscale(*px) for px in pixels]
+
+    return (np.asarray(pixels, dtype=np.float32) @ _GRAY_WEIGHTS).astype(np.uint8)
+
+
+def rgba_to_rgb_array(pixels, background: Tuple[int, int, int] = (255, 255, 255)):
+    """
+    Composite a batch of RGBA colors over a background
+
+    Args:
+        pixels: (..., 4) array (or iterable of (r, g, b, a)) with 0-255
+            channels and alpha 0-1
+        background: Background color (default white)
+
+    Returns:
+        (..., 3) uint8 array (list of tuples without numpy)
+
+    Example:
+        >>> out = rgba_to_rgb_array([(255, 0, 0, 0.5)])
+        >>> tuple(int(x) for x in out[0])
+        (255, 127, 127)
+    """
+    if np is None:
+        return [rgba_to_rgb(r, g, b, a, *background) for r, g, b, a in pixels]
+
+    arr = np.asarray(pixels, dtype=np.float32)
+    rgb, alpha = arr[..., :3], arr[..., 3:]
+    bg = np.array(background, dtype=np.float32)
+    return (rgb * alpha + bg * (1 - alpha)).astype(np.uint8)
+
+
+def nearest_web_safe_color_array(pixels):
+    """
+    Snap a batch of colors to the web-safe palette
+
+    Args:
+        pixels: (..., 3) array (or iterable of (r, g, b)) with 0-255 channels
+
+    Returns:
+        (..., 3) uint8 array (list of tuples without numpy)
+
+    Example:
+        >>> out = nearest_web_safe_color_array([(100, 100, 100)])
+        >>> tuple(int(x) for x in out[0])
+        (102, 102, 102)
+    """
+    if np is None:
+        return [nearest_web_safe_color(*px) for px in pixels]
+
+    arr = np.asarray(pixels, dtype=np.uint16)
+    return ((arr * 5 + 127) // 255 * 51).astype(np.uint8)
+
+
+def color_luminance_array(pixels):
+    """
+    Calculate relative luminance for a batch of colors
+
+    Args:
+        pixels: (..., 3) array (or iterable of (r, g, b)) with 0-255 channels
+
+    Returns:
+        (...,) float64 array of luminances (list of floats without numpy)
+
+    Example:
+        >>> lums = color_luminance_array([(255, 255, 255)])
+        >>> round(float(lums[0]), 6)
+        1.0
+    """
+    if np is None:
+        return [color_luminance(*px) for px in pixels]
+
+    # Gamma via table lookup instead of per-pixel pow, then one dot
+    # product to fold in the channel weights
+    lin = np.take(_SRGB_LIN_ARR, np.asarray(pixels, dtype=np.intp))
+    return lin @ np.array([0.2126, 0.7152, 0.0722])
+
+
+def invert_color_array(pixels):
+    """
+    Invert a batch of colors
+
+    Args:
+        pixels: (..., 3) array (or iterable of (r, g, b)) with 0-255 channels
+
+    Returns:
+        (..., 3) uint8 array (list of tuples without numpy)
+
+    Example:
+        >>> inv = invert_color_array([(255, 0, 0)])
+        >>> tuple(int(x) for x in inv[0])
+        (0, 255, 255)
+    """
+    if np is None:
+        return [invert_color(*px) for px in pixels]
+
+    return (255 - np.asarray(pixels, dtype=np.int16)).astype(np.uint8)
+
+
 # Export all functions
 __all__ = [
     'rgb_to_hex', 'hex_to_rgb',
@@ -587,4 +1069,8 @@ __all__ = [
     'lighten_color', 'darken_color', 'saturate_color', 'desaturate_color',
     'color_temperature', 'invert_color', 'sepia_tone',
     'color_distance', 'nearest_web_safe_color', 'rgba_to_rgb',
+    'rgb_to_hsl_array', 'rgb_to_hsv_array', 'hsv_to_rgb_array',
+    'blend_colors_array', 'invert_color_array', 'hex_array_to_rgb',
+    'color_luminance_array', 'sepia_tone_array', 'rgb_to_grayscale_array',
+    'rgba_to_rgb_array', 'nearest_web_safe_color_array',
 ]
@@ -4,6 +4,106 @@ Conversion Functions
 Unit conversions for length, weight, temperature, volume, speed, and more.
 """
 
+import math
+
+# Bound once so the angle helpers skip the per-call module attribute
+# lookup (they used to re-run `import math` inside the body too)
+_radians = math.radians
+_degrees = math.degrees
+
+# One factor per unit relative to its dimension's base unit. Any
+# src -> dst conversion within a dimension is then a single multiply,
+# including pairs with no dedicated wrapper below (e.g. miles to
+# inches). Temperature is affine (offset, not just scale) and keeps
+# its explicit functions.
+_FACTORS = {
+    # Length (base: meter)
+    'meters': ('length', 1.0),
+    'kilometers': ('length', 1000.0),
+    'miles': ('length', 1609.34),
+    'feet': ('length', 1 / 3.28084),
+    'inches': ('length', 0.0254),
+    'centimeters': ('length', 0.01),
+    # Weight/mass (base: kilogram)
+    'kilograms': ('weight', 1.0),
+    'pounds': ('weight', 1 / 2.20462),
+    'grams': ('weight', 0.001),
+    'ounces': ('weight', 0.001 / 0.035274),
+    'tons': ('weight', 1000.0),
+    # Volume (base: liter)
+    'liters': ('volume', 1.0),
+    'gallons': ('volume', 1 / 0.264172),
+    'milliliters': ('volume', 0.001),
+    'fluid_ounces': ('volume', 0.001 / 0.033814),
+    'cubic_meters': ('volume', 1000.0),
+    'cubic_feet': ('volume', 1000 / 35.3147),
+    # Speed (base: kilometer per hour)
+    'kmh': ('speed', 1.0),
+    'mph': ('speed', 1 / 0.621371),
+    'ms': ('speed', 3.6),
+    'knots': ('speed', 1.852),
+    # Time (base: second)
+    'seconds': ('time', 1.0),
+    'minutes': ('time', 60.0),
+    'hours': ('time', 3600.0),
+    'days': ('time', 86400.0),
+    'weeks': ('time', 604800.0),
+    # Energy (base: joule)
+    'joules': ('energy', 1.0),
+    'calories': ('energy', 1 / 0.239006),
+    'kilowatt_hours': ('energy', 3.6e6),
+    # Power (base: watt)
+    'watts': ('power', 1.0),
+    'horsepower': ('power', 745.7),
+    # Pressure (base: pascal)
+    'pascals': ('pressure', 1.0),
+    'psi': ('pressure', 1 / 0.000145038),
+    'bar': ('pressure', 100000.0),
+    'atmospheres': ('pressure', 101325.0),
+    # Area (base: square meter)
+    'square_meters': ('area', 1.0),
+    'square_feet': ('area', 1 / 10.7639),
+    'acres': ('area', 1 / 0.000247105),
+    'hectares': ('area', 10000.0),
+    # Data size (base: byte)
+    'bytes': ('data', 1.0),
+    'kilobytes': ('data', 1024.0),
+    'megabytes': ('data', 1024.0 ** 2),
+    'gigabytes': ('data', 1024.0 ** 3),
+    'terabytes': ('data', 1024.0 ** 4),
+    # Angle (base: degree)
+    'degrees': ('angle', 1.0),
+    'radians': ('angle', 180 / math.pi),
+    'gradians': ('angle', 9 / 10),
+}
+
+
+def convert(value: float, from_unit: str, to_unit: str) -> float:
+    """
+    Convert a value between any two units of the same dimension
+
+    Args:
+        value: Quantity to convert
+        from_unit: Source unit name (e.g. 'meters', 'pounds', 'kmh')
+        to_unit: Target unit name of the same dimension
+
+    Returns:
+        Converted value
+
+    Example:
+        >>> convert(1, 'kilometers', 'meters')
+        1000.0
+    """
+    from_dim, from_factor = _FACTORS[from_unit]
+    to_dim, to_factor = _FACTORS[to_unit]
+
+    if from_dim != to_dim:
+        raise ValueError(f"Cannot convert {from_unit} ({from_dim}) "
+                         f"to {to_unit} ({to_dim})")
+
+    return value * from_factor / to_factor
+
+
 # Length Conversions
 
 def meters_to_kilometers(meters: float) -> float:
@@ -102,12 +202,12 @@ def kelvin_to_celsius(kelvin: float) -> float:
 
 def fahrenheit_to_kelvin(fahrenheit: float) -> float:
     """Fahrenheit to Kelvin"""
-    return celsius_to_kelvin(fahrenheit_to_celsius(fahrenheit))
+    return (fahrenheit - 32) * 5/9 + 273.15
 
 
 def kelvin_to_fahrenheit(kelvin: float) -> float:
     """Kelvin to Fahrenheit"""
-    return celsius_to_fahrenheit(kelvin_to_celsius(kelvin))
+    return (kelvin - 273.15) * 9/5 + 32
 
 
 # Volume Conversions
@@ -360,14 +460,12 @@ def terabytes_to_gigabytes(tb: float) -> float:
 
 def degrees_to_radians(degrees: float) -> float:
     """Degrees to radians"""
-    import math
-    return math.radians(degrees)
+    return _radians(degrees)
 
 
 def radians_to_degrees(radians: float) -> float:
     """Radians to degrees"""
-    import math
-    return math.degrees(radians)
+    return _degrees(radians)
 
 
 def degrees_to_gradians(degrees: float) -> float:
@@ -394,6 +492,8 @@ def lper100km_to_mpg(lper100km: float) -> float:
 
 # Export all functions
 __all__ = [
+    # Generic
+    'convert',
     # Length
     'meters_to_kilometers', 'kilometers_to_meters',
     'meters_to_miles', 'miles_to_meters',
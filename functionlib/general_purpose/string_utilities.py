@@ -332,26 +332,29 @@ def levenshtein_distance(s1: str, s2: str) -> int:
         >>> levenshtein_distance("kitten", "sitting")
         3
     """
+    # In-body swap instead of a recursive call (Python has no tail-call
+    # optimization, so the old form pushed a frame just to reorder args)
     if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
-    
+        s1, s2 = s2, s1
+
     if len(s2) == 0:
         return len(s1)
-    
-    previous_row = range(len(s2) + 1)
-    
+
+    # Two preallocated rows swapped by reference each outer iteration;
+    # the previous version built a fresh list via append per row
+    n = len(s2)
+    prev = list(range(n + 1))
+    curr = [0] * (n + 1)
+
     for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        
+        curr[0] = i + 1
         for j, c2 in enumerate(s2):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        
-        previous_row = current_row
-    
-    return previous_row[-1]
+            curr[j + 1] = min(prev[j + 1] + 1,
+                              curr[j] + 1,
+                              prev[j] + (c1 != c2))
+        prev, curr = curr, prev
+
+    return prev[n]
 
 
 def similarity_ratio(s1: str, s2: str) -> float: